@@ -0,0 +1,51 @@
+"""
+Time of each poker.analysis function on a synthetic multi-thousand-hand dataset.
+
+Each function runs on the whole Poker object, on a DocumentFilter of one player, and (where it has a
+columnar path) on a Poker built with 'columnar'.
+
+Run from the repository root:
+    python -m benchmarks.bench_analysis [n_files] [n_hands]
+"""
+import sys
+import time
+import tempfile
+from poker.classes.poker import Poker
+from poker.classes.document_filter import DocumentFilter
+from poker import analysis
+from benchmarks.synthetic import write_logs, ME, GROUPED
+
+FUNCTIONS = ((analysis.face_card_in_winning_cards, {}), (analysis.longest_streak, {}),
+             (analysis.raise_signal_winning, {}), (analysis.small_or_big_blind_win, {}),
+             (analysis.player_verse_player, {}), (analysis.bluff_study, {}), (analysis.static_analysis, {}),
+             (analysis.pressure_or_hold, {'bet': 100, 'position': 'Pre Flop'}), (analysis.ts_analysis, {}))
+
+
+def _best(func, data, kwargs: dict, repeat: int = 3) -> float:
+    """Fastest of repeat calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_files: int = 20, n_hands: int = 300):
+    with tempfile.TemporaryDirectory() as folder:
+        write_logs(folder, n_files, n_hands)
+        start = time.perf_counter()
+        poker = Poker({'me': ME, 'repo': folder, 'grouped': GROUPED, 'memo_size': 0})
+        load = time.perf_counter() - start
+        columnar = Poker({'me': ME, 'repo': folder, 'grouped': GROUPED, 'memo_size': 0, 'columnar': True})
+    player = DocumentFilter(poker, player_lst='Peter')
+
+    print(f'{len(poker.hands)} hands, {len(poker.rows)} rows, loaded in {load:.2f} s')
+    print(f"{'function':28s} {'Poker':>9s} {'filter':>9s} {'columnar':>9s}")
+    for func, kwargs in FUNCTIONS:
+        times = [_best(func, d, kwargs) for d in (poker, player, columnar)]
+        print(f'{func.__name__:28s} ' + ' '.join(f'{t * 1e3:7.1f}ms' for t in times))
+
+
+if __name__ == '__main__':
+    main(*(int(v) for v in sys.argv[1:3]))
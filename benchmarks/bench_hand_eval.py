@@ -0,0 +1,102 @@
+"""
+Evaluations per second of the bitmask hand evaluator against the counting calculate_hand it replaced.
+
+Run from the repository root:
+    python -m benchmarks.bench_hand_eval [n_hands]
+"""
+import sys
+import time
+import random
+from poker.utils.tools import DECK, evaluate_hand, encode_cards, evaluate_hands, encode_card_array
+
+
+def _legacy_calculate_hand(cards: list) -> str:
+    """The category as the counting calculate_hand named it, kept to compare speed and results."""
+    ace, cards = [], list(cards)
+    if not cards:
+        return None
+    for ind, card in enumerate(cards):
+        for face, value in (('J', '11'), ('Q', '12'), ('K', '13'), ('A', '14')):
+            if face in card:
+                cards[ind] = card.replace(face, value)
+                if face == 'A':
+                    ace.append(card.replace('A', '1'))
+                break
+    cards = list(set(cards + ace))
+    n = len(cards)
+    nums = [int(card.split(' ')[0]) for card in cards]
+    suits = [card.split(' ')[1] for card in cards]
+
+    def count(values: list, k: int) -> bool:
+        return any(values.count(v) == k for v in values)
+
+    def straight(values: list) -> bool:
+        values = sorted(values, reverse=True)
+        t = [j for i, j in enumerate(values[:-1]) if j - 1 == values[i + 1]] + [values[-1]]
+        return t == list(range(t[0], t[0] - 5, -1))
+
+    def straight_flush() -> bool:
+        return count(suits, 5) and straight([nums[i] for i, s in enumerate(suits) if suits.count(s) == 5])
+
+    def royal_flush() -> bool:
+        if not (count(suits, 5) and straight(nums)):
+            return False
+        top = sorted(zip(nums, suits), key=lambda x: x[0], reverse=True)[:5]
+        return [c[0] for c in top] == [14, 13, 12, 11, 10]
+
+    if n >= 5 and royal_flush():
+        return 'Royal Flush'
+    elif n >= 5 and straight_flush():
+        return 'Straight Flush'
+    elif n >= 4 and count(nums, 4):
+        return 'Four of a Kind'
+    elif n >= 5 and count(nums, 3) and count(nums, 2):
+        return 'Full House'
+    elif n >= 5 and count(suits, 5):
+        return 'Flush'
+    elif n >= 5 and straight(nums):
+        return 'Straight'
+    elif n >= 3 and count(nums, 3):
+        return 'Three of a Kind'
+    elif n >= 4 and sum(nums.count(v) == 2 for v in nums) >= 2:
+        return 'Two Pair'
+    elif n >= 2 and count(nums, 2):
+        return 'Pair'
+    return {14: 'A', 13: 'K', 12: 'Q', 11: 'J'}.get(max(nums), str(max(nums))) + ' High'
+
+
+def _rate(func, hands: list, repeat: int = 3) -> float:
+    """Best evaluations per second over repeat passes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for h in hands:
+            func(h)
+        best = min(best, time.perf_counter() - start)
+    return len(hands) / best
+
+
+def main(n_hands: int = 50000):
+    rnd = random.Random(0)
+    hands = [rnd.sample(DECK, 7) for _ in range(n_hands)]
+    codes = [encode_cards(h) for h in hands]
+    legacy = [_legacy_calculate_hand(h) for h in hands]
+    current = [evaluate_hand(h)[0] for h in hands]
+    agree = sum(a == b for a, b in zip(legacy, current)) / n_hands
+
+    array = encode_card_array(hands)
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        evaluate_hands(array)
+        best = min(best, time.perf_counter() - start)
+
+    print(f'{n_hands} random 7 card hands, categories agree with the counting evaluator on {agree:.1%}')
+    print(f'calculate_hand, counting      : {_rate(_legacy_calculate_hand, hands):>12,.0f} /s')
+    print(f'evaluate_hand, card strings   : {_rate(evaluate_hand, hands):>12,.0f} /s')
+    print(f'evaluate_hand, card codes     : {_rate(evaluate_hand, codes):>12,.0f} /s')
+    print(f'evaluate_hands, card array    : {n_hands / best:>12,.0f} /s')
+
+
+if __name__ == '__main__':
+    main(*(int(v) for v in sys.argv[1:2]))
@@ -0,0 +1,105 @@
+"""
+Per-line cost of classifying Poker Now log entries, and of the whole parser.
+
+Compares the single precompiled pattern used by the parser (_LINE) with the substring chain it replaced,
+reproduced below for the line shapes the pattern covers, and checks both agree on every line.
+
+Run from the repository root:
+    python -m benchmarks.bench_parser [n_files] [n_hands]
+"""
+import sys
+import time
+import tempfile
+from poker.utils.functions import read_csv, parser, _LINE, _MOVES, _CARDS, _SUITS, _suit_name
+from benchmarks.synthetic import write_logs, ME, GROUPED
+
+
+def _legacy_classify(entry: str) -> tuple:
+    """Move, value and cards of an entry, as the substring chain did before the single pattern."""
+    entry = entry.strip().replace("â\x99£", " Clubs").replace("â\x99¦", " Diamonds").replace("â\x99¥", " Hearts")\
+        .replace("â\x99", " Spades").replace('1 Clubs', 'A Clubs').replace('1 Diamonds', 'A Diamonds')\
+        .replace('1 Hearts', 'A Hearts').replace('1 Spades', 'A Spades')
+    value = entry.replace(' and go all in', '') if entry.endswith(' and go all in') else entry
+    if ' calls ' in entry:
+        return 'Call', float(value.split(' calls ')[1]), None
+    elif entry.endswith('checks'):
+        return 'Checks', None, None
+    elif entry.endswith('folds'):
+        return 'Fold', None, None
+    elif ' bets ' in entry:
+        return 'Bet', float(value.split(' bets ')[1]), None
+    elif ' shows ' in entry:
+        return 'Show', None, [j.strip() for j in entry.split(' shows a ')[1].replace('.', '').split(',')]
+    elif ' collected ' in entry:
+        return 'Win', float(entry.split(' collected ')[1].split(' from ')[0]), None
+    elif entry.startswith('Player stacks: '):
+        return None, None, None
+    elif ' big blind of ' in entry:
+        return 'Big Blind', float(value.split(' big blind of ')[1]), None
+    elif ' raises to ' in entry:
+        return 'Raise', float(value.split(' raises to ')[1]), None
+    elif ' small blind of ' in entry:
+        return 'Small Blind', float(value.split(' small blind of ')[1]), None
+    elif entry.startswith('Your hand is'):
+        return 'Your Hand', None, [j.strip() for j in entry.replace('Your hand is ', '').split(',')]
+    for prefix, move in (('Flop', 'Flop'), ('Turn', 'Turn'), ('River', 'River'), ('Undealt cards', 'Undealt Cards')):
+        if entry.startswith(prefix) or entry.startswith(prefix.lower()):
+            return move, None, [j.strip() for j in entry.split('[')[1].replace(']', '').split(',')]
+    return None, None, None
+
+
+def _single_pass(entry: str) -> tuple:
+    """Move, value and cards of an entry, as the parser reads them from one match of _LINE."""
+    entry = entry.strip()
+    if 'â' in entry:
+        entry = _SUITS.sub(_suit_name, entry)
+    line = _LINE.match(entry)
+    if not line:
+        return None, None, None
+    player, verb, value, check_fold, shown, won, street, board, hole = line.groups()
+    if verb:
+        return _MOVES[verb], float(value), None
+    elif check_fold:
+        return _MOVES[check_fold], None, None
+    elif shown is not None:
+        return 'Show', None, _CARDS.split(shown.replace('.', '').strip())
+    elif won is not None:
+        return 'Win', float(won), None
+    elif street:
+        return _MOVES[street.lower()], None, _CARDS.split(board.replace(']', '').strip())
+    return 'Your Hand', None, _CARDS.split(hole.strip())
+
+
+def _best(func, entries: list, repeat: int = 5) -> float:
+    """Fastest of repeat passes over entries, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for e in entries:
+            func(e)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n_files: int = 20, n_hands: int = 300):
+    with tempfile.TemporaryDirectory() as folder:
+        names = write_logs(folder, n_files, n_hands)
+        entries = [i['entry'] for name in names for i in read_csv(folder, name)]
+        mismatched = [e for e in entries if _legacy_classify(e) != _single_pass(e)]
+        if mismatched:
+            raise AssertionError(f'{len(mismatched)} entries classified differently, e.g. {mismatched[0]!r}')
+
+        n = len(entries)
+        legacy, single = _best(_legacy_classify, entries), _best(_single_pass, entries)
+        start = time.perf_counter()
+        rows = sum(len(parser(folder, name, ME, GROUPED)[0]) for name in names)
+        full = time.perf_counter() - start
+
+    print(f'{n} lines, {n_files} logs of {n_hands} hands, classifications agree on every line')
+    print(f'classify, substring chain : {legacy / n * 1e6:6.2f} us/line')
+    print(f'classify, single pattern  : {single / n * 1e6:6.2f} us/line  ({legacy / single:.1f}x)')
+    print(f'parser, end to end        : {full / rows * 1e6:6.2f} us/row  ({rows} rows)')
+
+
+if __name__ == '__main__':
+    main(*(int(v) for v in sys.argv[1:3]))
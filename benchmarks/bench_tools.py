@@ -0,0 +1,85 @@
+"""
+Microseconds per call of the NumPy-backed native_* statistics against the pure Python versions they replaced.
+
+Run from the repository root:
+    python -m benchmarks.bench_tools
+"""
+import time
+import random
+import numpy as np
+from poker.utils.tools import native_mean, native_median, native_std, native_max, native_skew
+
+
+def _clean(data) -> list:
+    """List, drop nan/None and cast to float, the three copies the pure Python versions made."""
+    data = data.tolist() if isinstance(data, np.ndarray) else list(data)
+    return [float(i) for i in data if i == i and i is not None]
+
+
+def _legacy_mean(data) -> float:
+    data = _clean(data)
+    return sum(data) / len(data) if data else 0.0
+
+
+def _legacy_median(data) -> float:
+    data = sorted(_clean(data))
+    index = (len(data) - 1) // 2
+    return data[index] if len(data) % 2 else _legacy_mean([data[index], data[index + 1]])
+
+
+def _legacy_std(data, ddof: int = 1) -> float:
+    data = _clean(data)
+    mu = _legacy_mean(data)
+    return (sum((x - mu) ** 2 for x in data) / (len(data) - ddof)) ** .5
+
+
+def _legacy_max(data) -> float:
+    largest = 0
+    for i in _clean(data):
+        if i > largest:
+            largest = i
+    return largest
+
+
+def _legacy_skew(data) -> float:
+    data = _clean(data)
+    n, mu = len(data), _legacy_mean(data)
+    return ((sum(i - mu for i in data) ** 3 / n) / _legacy_std(data) ** 3) * ((n * (n - 1)) ** .5) / (n - 2)
+
+
+PAIRS = (('mean', _legacy_mean, native_mean), ('median', _legacy_median, native_median),
+         ('std', _legacy_std, native_std), ('max', _legacy_max, native_max), ('skew', _legacy_skew, native_skew))
+
+
+def _per_call(func, data, budget: float = 0.2) -> float:
+    """Best microseconds per call over a few timed batches."""
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < budget / 10:
+        func(data)
+        calls += 1
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func(data)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1e6
+
+
+def main():
+    rnd = random.Random(0)
+    print(f"{'n':>6s} {'input':8s} " + ' '.join(f'{name:>16s}' for name, _, _ in PAIRS))
+    for n in (10, 100, 10000):
+        values = [rnd.uniform(1, 1000) for _ in range(n)]
+        for kind, data in (('list', values), ('ndarray', np.array(values))):
+            if kind == 'ndarray' and n < 10000:
+                continue
+            cells = []
+            for name, legacy, current in PAIRS:
+                cells.append(f'{_per_call(legacy, data):7.1f}->{_per_call(current, data):<7.1f}')
+            print(f'{n:6d} {kind:8s} ' + ' '.join(f'{c:>16s}' for c in cells))
+    print('old->new, microseconds per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Synthetic Poker Now logs for the benchmarks, written newest row first like real exports.
+"""
+import os
+import csv
+import random
+import datetime
+
+SUITS = ('♣', '♦', '♥', '♠')
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+ME = 'Peter @ Jf-Q4OmfIt'
+PLAYERS = (ME, 'Flynn @ YEtsj6CMK4', 'Mike @ 1_FRcDzJU-', 'Johnny @ 3fuMmmzEQ-', 'Robby @ FZayb4wOU1',
+           'Stranger @ zzzzzzzzzz', 'Carter @ 48QVRRsiae')
+GROUPED = {'Peter': ('Jf-Q4OmfIt',), 'Flynn': ('YEtsj6CMK4',), 'Mike': ('1_FRcDzJU-',), 'Johnny': ('3fuMmmzEQ-',),
+           'Robby': ('FZayb4wOU1',), 'Carter': ('48QVRRsiae',)}
+
+
+def _card(c: tuple) -> str:
+    return f"{RANKS[c[0]]}{SUITS[c[1]]}"
+
+
+def write_log(path: str, seed: int, n_hands: int, players: tuple = PLAYERS,
+              start: datetime.datetime = datetime.datetime(2021, 1, 1, 20)) -> int:
+    """Write one log of n_hands hands, returns the number of rows."""
+    rnd, lines, t = random.Random(seed), [], [start]
+
+    def emit(entry: str):
+        t[0] += datetime.timedelta(milliseconds=rnd.randint(200, 15000))
+        lines.append((entry, t[0]))
+
+    seated, stacks, nxt = list(players[:4]), {p: 1000 for p in players[:4]}, 4
+    emit("The game's big blind was changed from 10 to 20.")
+    for p in seated:
+        emit(f'The player "{p}" requested a seat.')
+        emit(f'The admin approved the player "{p}" participation with a stack of 1000.')
+        emit(f'The player "{p}" joined the game with a stack of 1000.')
+    for h in range(1, n_hands + 1):
+        joined = None
+        if h % 7 == 0 and len(players) > nxt:
+            joined = players[nxt]
+            nxt += 1
+            seated.append(joined)
+            stacks[joined] = 1000
+            emit(f'The player "{joined}" joined the game with a stack of 1000.')
+        if h % 11 == 0 and len(seated) > 3:
+            q = seated.pop(0)
+            emit(f'The player "{q}" quits the game with a stack of {stacks.pop(q)}.')
+        emit(f"-- starting hand #{h} (id: h{seed}x{h})  No Limit Texas Hold'em (dealer: \"{seated[0]}\") --")
+        emit('Player stacks: ' + ' | '.join(f'#{k + 1} "{p}" ({stacks[p]})' for k, p in enumerate(seated)))
+        deck = [(r, s) for r in range(13) for s in range(4)]
+        rnd.shuffle(deck)
+        holes = {p: [deck.pop(), deck.pop()] for p in seated}
+        if ME in holes:
+            emit('Your hand is ' + ', '.join(_card(c) for c in holes[ME]))
+        sb, bb, pot = seated[1 % len(seated)], seated[2 % len(seated)], 0
+        emit(f'"{sb}" posts a small blind of 10')
+        emit(f'"{bb}" posts a big blind of 20')
+        stacks[sb], stacks[bb], pot = stacks[sb] - 10, stacks[bb] - 20, 30
+        if joined is not None and joined not in (sb, bb):
+            emit(f'"{joined}" posts a {rnd.choice(("missed", "missing"))} big blind of 20')
+            stacks[joined], pot = stacks[joined] - 20, pot + 20
+        live, board = list(seated), []
+        for street in range(4):
+            if street == 1:
+                board = [deck.pop(), deck.pop(), deck.pop()]
+                emit('Flop:  [' + ', '.join(_card(c) for c in board) + ']')
+            elif street == 2:
+                board.append(deck.pop())
+                emit('Turn: ' + ', '.join(_card(c) for c in board[:3]) + ' [' + _card(board[3]) + ']')
+            elif street == 3:
+                board.append(deck.pop())
+                emit('River: ' + ', '.join(_card(c) for c in board[:4]) + ' [' + _card(board[4]) + ']')
+            for p in list(live):
+                if len(live) == 1:
+                    break
+                x, all_in = rnd.random(), ' and go all in' if rnd.random() < 0.05 else ''
+                if x < 0.25:
+                    emit(f'"{p}" folds')
+                    live.remove(p)
+                    continue
+                if x < 0.45:
+                    emit(f'"{p}" checks')
+                    continue
+                if x < 0.7:
+                    v, verb = rnd.choice((20, 40, 60)), 'calls'
+                elif x < 0.85:
+                    v, verb = rnd.choice((40, 80, 120)), 'bets'
+                else:
+                    v, verb = rnd.choice((100, 200)), 'raises to'
+                emit(f'"{p}" {verb} {v}{all_in}')
+                stacks[p], pot = stacks[p] - v, pot + v
+            if len(live) == 1:
+                break
+        if rnd.random() < 0.1:
+            emit(f'Uncalled bet of 40 returned to "{live[0]}"')
+        w = live[0]
+        if len(live) > 1 and len(board) == 5:
+            for p in live:
+                emit(f'"{p}" shows a ' + ', '.join(_card(c) for c in holes[p]) + '.')
+            combo = holes[w] + board[:3]
+            emit(f'"{w}" collected {pot} from pot with Pair, {RANKS[combo[0][0]]}\'s (combination: '
+                 + ', '.join(_card(c) for c in combo) + ')')
+        else:
+            if len(board) < 5 and rnd.random() < 0.3:
+                rest = [deck.pop() for _ in range(5 - len(board))]
+                emit('Undealt cards: ' + ', '.join(_card(c) for c in board) + ' [' + ', '.join(_card(c) for c in rest) + ']')
+            emit(f'"{w}" collected {pot} from pot')
+        stacks[w] += pot
+        emit(f'-- ending hand #{h} --')
+        if h % 13 == 0:
+            s = seated[-1]
+            emit(f'The player "{s}" stand up with the stack of {stacks[s]}.')
+            emit(f'The player "{s}" sit back with the stack of {stacks[s]}.')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['entry', 'at', 'order'])
+        for k in range(len(lines) - 1, -1, -1):
+            entry, ts = lines[k]
+            writer.writerow([entry, ts.strftime('%Y-%m-%dT%H:%M:%S.') + f'{ts.microsecond // 1000:03d}Z',
+                             str(16200000000000 + k)])
+    return len(lines)
+
+
+def write_logs(folder: str, n_files: int = 20, n_hands: int = 300) -> list:
+    """Write n_files logs of n_hands hands each into folder, returns the file names."""
+    os.makedirs(folder, exist_ok=True)
+    names = []
+    for i in range(n_files):
+        rnd = random.Random(i)
+        players = PLAYERS[:1] + tuple(rnd.sample(PLAYERS[1:], len(PLAYERS) - 1))
+        names.append(f'poker_now_log_{i:03d}.csv')
+        write_log(os.path.join(folder, names[-1]), i, n_hands, players,
+                  datetime.datetime(2021, 1, 1, 20) + datetime.timedelta(days=3 * i))
+    return names
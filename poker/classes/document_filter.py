@@ -0,0 +1,145 @@
+"""
+"""
+import datetime
+from dataclasses import dataclass
+from functools import reduce
+from typing import Union
+import numpy as np
+import pandas as pd
+from poker.utils.class_functions import _get_attributes
+
+
+def _to_datetime64(v: Union[str, datetime.datetime, datetime.date]) -> np.datetime64:
+    return np.datetime64(v, 'us')
+
+
+def _postings(values: list) -> dict:
+    """Returns sorted index arrays per value."""
+    d = {}
+    for ind, v in enumerate(values):
+        d.setdefault(v, []).append(ind)
+    return {k: np.array(v, dtype=np.int64) for k, v in d.items()}
+
+
+def _sorted(values: list, dtype) -> tuple:
+    """Returns the argsort of values and the values in that order."""
+    arr = np.array(values, dtype=dtype)
+    order = np.argsort(arr, kind='stable')
+    return order, arr[order]
+
+
+def _filter_index(data) -> dict:
+    """
+    Returns the indexes DocumentFilter searches, built once per state of Poker.rows/hands.
+
+    Rows and hands get posting lists (sorted row/hand indexes) per game id and player, rows also per move
+    and position, and both get sorted times and hand numbers for range lookups.
+    """
+    state = (id(data.rows), len(data.rows), id(data.hands), len(data.hands))
+    index = getattr(data, '_filter_index', None)
+    if index is not None and index['state'] == state:
+        return index
+    rows, hands = data.rows, data.hands
+    index = {'state': state,
+             'rows': {'game_id': _postings([i['game_id'] for i in rows]),
+                      'move': _postings([i.get('move') for i in rows]),
+                      'position': _postings([i.get('position') for i in rows]),
+                      'player': {k: np.array(v, dtype=np.int64) for k, v in data._index['rows'].items()},
+                      'time': _sorted([i['at'] for i in rows], 'datetime64[us]'),
+                      'hand_number': _sorted([i.get('hand_number', -1) for i in rows], np.int64)},
+             'hands': {'game_id': _postings([h.game_id for h in hands]),
+                       'player': {k: np.array(sorted(set(j[0] for j in v)), dtype=np.int64)
+                                  for k, v in data._index['hands'].items()},
+                       'time': _sorted([h.start_time for h in hands], 'datetime64[us]'),
+                       'hand_number': _sorted([h.hand_number for h in hands], np.int64)}}
+    data._filter_index = index
+    return index
+
+
+def _select(index: dict, n: int, lists: dict, ranges: dict) -> np.ndarray:
+    """Intersect the posting lists of each requested value with the requested ranges, smallest first."""
+    parts = []
+    for key, values in lists.items():
+        if values is not None:
+            found = [index[key][v] for v in values if v in index[key]]
+            parts.append(np.unique(np.concatenate(found)) if found else np.array([], dtype=np.int64))
+    for key, (lo, hi, side) in ranges.items():
+        if lo is not None or hi is not None:
+            order, values = index[key]
+            start = np.searchsorted(values, lo, 'left') if lo is not None else 0
+            stop = np.searchsorted(values, hi, side) if hi is not None else len(values)
+            parts.append(np.sort(order[start:stop]))
+    if not parts:
+        return np.arange(n, dtype=np.int64)
+    return reduce(np.intersect1d, sorted(parts, key=len))
+
+
+@dataclass
+class DocumentFilter:
+    """
+    A class that selects rows and hands of a Poker object.
+
+    Attributes:
+        rows (list): The parsed rows that match every given filter.
+        hands (list): The hands that match the player, game, date and hand number filters.
+        row_index (np.ndarray): Positions of rows in Poker.rows.
+        hand_index (np.ndarray): Positions of hands in Poker.hands.
+        df (pd.DataFrame): The selected rows as a DataFrame.
+
+    Methods:
+        items(): Return the attributes of the class.
+    """
+    def __init__(self, data, player_lst: Union[list, str] = None, game_id_lst: Union[list, str] = None,
+                 start_date: Union[str, datetime.datetime] = None, end_date: Union[str, datetime.datetime] = None,
+                 hand_range: tuple = None, position_lst: Union[list, str] = None, move_lst: Union[list, str] = None):
+        """
+        Initialize a DocumentFilter instance.
+
+        Args:
+            data (Poker): The Poker object to select from.
+            player_lst (list): Names from grouped.
+            game_id_lst (list): Game ids, the log file names.
+            start_date (str or datetime): Keep rows/hands at or after this time.
+            end_date (str or datetime): Keep rows/hands before this time.
+            hand_range (tuple): First and last hand number to keep, inclusive.
+            position_lst (list): Positions ('Pre Flop', 'Post Flop', ..), rows only.
+            move_lst (list): Moves ('Call', 'Raise', 'Win', ..), rows only.
+        """
+        def as_list(v):
+            return [v] if isinstance(v, str) else v
+
+        self._data = data
+        self.player_lst, self.game_id_lst = as_list(player_lst), as_list(game_id_lst)
+        self.position_lst, self.move_lst = as_list(position_lst), as_list(move_lst)
+        self.start_date, self.end_date, self.hand_range = start_date, end_date, hand_range
+        index = _filter_index(data)
+        start = _to_datetime64(start_date) if start_date is not None else None
+        end = _to_datetime64(end_date) if end_date is not None else None
+        first, last = hand_range if hand_range is not None else (None, None)
+        ranges = {'time': (start, end, 'left'), 'hand_number': (first, last, 'right')}
+        self.row_index = _select(index['rows'], len(data.rows),
+                                 {'player': self.player_lst, 'game_id': self.game_id_lst,
+                                  'position': self.position_lst, 'move': self.move_lst}, ranges)
+        self.hand_index = _select(index['hands'], len(data.hands),
+                                  {'player': self.player_lst, 'game_id': self.game_id_lst}, ranges)
+        self.rows = [data.rows[i] for i in self.row_index]
+        self.hands = [data.hands[i] for i in self.hand_index]
+        self._df = None
+
+    def __repr__(self) -> str:
+        return f"Rows: ({len(self.rows)}), Hands: ({len(self.hands)})"
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if self._df is None:
+            self._df = pd.DataFrame(self.rows, index=self.row_index)
+        return self._df
+
+    def items(self):
+        """
+        Return the attributes of the class.
+
+        Returns:
+            dict: The attributes of the DocumentFilter object.
+        """
+        return _get_attributes(self)
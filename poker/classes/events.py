@@ -0,0 +1,400 @@
+"""
+"""
+import datetime
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Union
+import numpy as np
+import pandas as pd
+from poker.utils.class_functions import _get_attributes, _group_name_blank
+from poker.classes.resolver import IdentityResolver, _as_resolver
+from poker.utils.tools import percent
+
+MOVES = ('Player Stacks', 'Small Blind', 'Big Blind', 'Call', 'Checks', 'Fold', 'Bet', 'Raise', 'Show', 'Win',
+         'Your Hand', 'Flop', 'Turn', 'River', 'Undealt Cards', 'Uncalled Bet', 'Joined', 'Request', 'Approved',
+         'Stands', 'Sits', 'Quits', 'Game')
+POSITIONS = ('Pre Flop', 'Post Flop', 'Post Turn', 'Post River')
+MOVE_CODES = {m: c for c, m in enumerate(MOVES)}
+POSITION_CODES = {p: c for c, p in enumerate(POSITIONS)}
+
+# Table -> column -> array typecode. Cards and stacks are long-format tables pointing at events and hands.
+_COLUMNS = {'events': {'time': 'q', 'start': 'q', 'seconds': 'd', 'game': 'i', 'hand': 'i', 'move': 'b', 'player': 'i',
+                       'action_from': 'i', 'value': 'd', 'action_amount': 'd', 'pot': 'd', 'position': 'b',
+                       'chips': 'd', 'all_in': 'b'},
+            'cards': {'event': 'q', 'card': 'i'},
+            'hands': {'game': 'i', 'hand': 'i', 'start': 'q', 'end': 'q', 'pot': 'd'},
+            'stacks': {'hand': 'q', 'player': 'i', 'starting': 'd', 'ending': 'd'}}
+# Columns holding codes into the players / games / cards lists, -1 when missing.
+_CODED = {'game': 'games', 'player': 'players', 'action_from': 'players', 'card': 'cards'}
+_EPOCH, _MS = datetime.datetime(1970, 1, 1), datetime.timedelta(milliseconds=1)
+
+
+def _ms(t: datetime.datetime) -> int:
+    """Datetime to integer milliseconds since the epoch, -1 when missing."""
+    return (t - _EPOCH) // _MS if t is not None else -1
+
+
+def _float(v) -> float:
+    return float(v) if v is not None else np.nan
+
+
+@dataclass
+class EventTable:
+    """
+    A columnar store of parsed Poker Now rows, an alternative to the per-row dicts.
+
+    Attributes:
+        players (list): Player strings ("Name @ ID"), indexed by player code.
+        games (list): Game ids, indexed by game code.
+        cards (list): Card strings, indexed by card code.
+        events (dict): One array per column, one entry per parsed row.
+        cards_table (dict): Long-format (event, card) table of the cards seen in each row.
+        hands (dict): One entry per completed hand (game, hand, start, end, pot).
+        stacks (dict): Long-format (hand, player, starting, ending) chip stacks of each completed hand.
+
+    Methods:
+        items(): Return the attributes of the class.
+        add_row(): Append a parsed row.
+        add_hand(): Append a completed Hand.
+        extend(): Append another EventTable, remapping its codes.
+        truncate(): Drop the events and hands from given positions on.
+        from_rows(): Build a table from parsed rows and hands.
+        running_total(): Vectorized Poker.running_total.
+        card_count(): Vectorized Poker.card_count.
+        player_stats(): Vectorized Poker.player_stats.
+        ts_analysis(): Vectorized poker.analysis.ts_analysis.
+    """
+    def __init__(self):
+        """
+        Initialize an empty EventTable.
+        """
+        self.players, self.games, self.cards = [], [], []
+        self._codes = {'players': {}, 'games': {}, 'cards': {}}
+        self._buffers = {t: {c: array(tc) for c, tc in cols.items()} for t, cols in _COLUMNS.items()}
+        self._arrays = {}
+
+    def __repr__(self) -> str:
+        return f"Events: ({len(self._buffers['events']['time'])}), Hands: ({len(self._buffers['hands']['hand'])})"
+
+    def __len__(self) -> int:
+        return len(self._buffers['events']['time'])
+
+    def items(self):
+        """
+        Return the attributes of the class.
+
+        Returns:
+            dict: The attributes of the EventTable object.
+        """
+        return _get_attributes(self)
+
+    def _code(self, kind: str, value) -> int:
+        if value is None:
+            return -1
+        codes = self._codes[kind]
+        if value not in codes:
+            codes[value] = len(codes)
+            getattr(self, kind).append(value)
+        return codes[value]
+
+    def _table(self, name: str) -> dict:
+        if name not in self._arrays:
+            self._arrays[name] = {c: np.frombuffer(b, dtype=b.typecode).copy() for c, b in self._buffers[name].items()}
+        return self._arrays[name]
+
+    @property
+    def events(self) -> dict:
+        return self._table('events')
+
+    @property
+    def cards_table(self) -> dict:
+        return self._table('cards')
+
+    @property
+    def hands(self) -> dict:
+        return self._table('hands')
+
+    @property
+    def stacks(self) -> dict:
+        return self._table('stacks')
+
+    def add_row(self, row: dict) -> None:
+        """
+        Append a parsed row.
+
+        Args:
+            row (dict): A row as produced by the parser.
+        """
+        b, player = self._buffers['events'], row.get('player')
+        ind = len(b['time'])
+        b['time'].append(_ms(row['at']))
+        b['start'].append(_ms(row.get('hand_startTs') or row['at']))
+        b['seconds'].append((row['at'] - row['decisionTime']).total_seconds())
+        b['game'].append(self._code('games', row['game_id']))
+        b['hand'].append(row.get('hand_number', -1))
+        b['move'].append(MOVE_CODES.get(row.get('move'), -1))
+        b['player'].append(self._code('players', player))
+        b['action_from'].append(self._code('players', row.get('actionFrom')))
+        b['value'].append(_float(row.get('value')))
+        b['action_amount'].append(_float(row.get('actionAmount')))
+        b['pot'].append(row['pot'])
+        b['position'].append(POSITION_CODES.get(row['position'], -1))
+        b['chips'].append(_float(row.get(f"current_chips_{player}")) if player else np.nan)
+        b['all_in'].append(bool(row.get('allIn')))
+        if row.get('cards'):
+            c = self._buffers['cards']
+            for card in row['cards']:
+                c['event'].append(ind)
+                c['card'].append(self._code('cards', card))
+        self._arrays = {}
+
+    def add_hand(self, hand) -> None:
+        """
+        Append a completed Hand.
+
+        Args:
+            hand (Hand): A Hand as produced by the parser.
+        """
+        b, s = self._buffers['hands'], self._buffers['stacks']
+        ind = len(b['hand'])
+        b['game'].append(self._code('games', hand.game_id))
+        b['hand'].append(hand.hand_number)
+        b['start'].append(_ms(hand.start_time))
+        b['end'].append(_ms(hand.end_time))
+        b['pot'].append(hand.pot_size)
+        for player, chips in hand.starting_chips.items():
+            s['hand'].append(ind)
+            s['player'].append(self._code('players', player))
+            s['starting'].append(chips)
+            s['ending'].append(_float(hand.ending_chips.get(player)))
+        self._arrays = {}
+
+    def extend(self, other: 'EventTable') -> None:
+        """
+        Append another EventTable, remapping its player, game and card codes onto this one.
+
+        Args:
+            other (EventTable): The table to append, e.g. one parsed in another process.
+        """
+        maps = {kind: np.array([self._code(kind, v) for v in getattr(other, kind)] + [-1], dtype=np.int64)
+                for kind in ('players', 'games', 'cards')}
+        offsets = {'event': len(self), 'hand': len(self._buffers['hands']['hand'])}
+        for name in _COLUMNS:
+            for col, values in other._table(name).items():
+                if col in _CODED:
+                    values = maps[_CODED[col]][values]
+                elif name in ('cards', 'stacks') and col in offsets:
+                    values = values + offsets[col]
+                buf = self._buffers[name][col]
+                buf.frombytes(values.astype(buf.typecode).tobytes())
+        self._arrays = {}
+
+    def truncate(self, events: int, hands: int) -> None:
+        """
+        Drop the events and hands from the given positions on, with their cards and stacks.
+
+        Args:
+            events (int): Number of events kept.
+            hands (int): Number of hands kept.
+        """
+        cut = {'events': events, 'hands': hands,
+               'cards': bisect_left(self._buffers['cards']['event'], events),
+               'stacks': bisect_left(self._buffers['stacks']['hand'], hands)}
+        for name, n in cut.items():
+            for buf in self._buffers[name].values():
+                del buf[n:]
+        self._arrays = {}
+
+    @classmethod
+    def from_rows(cls, rows: list, hands: list) -> 'EventTable':
+        """
+        Build a table from parsed rows and hands.
+
+        Args:
+            rows (list): Parsed rows, e.g. Poker.rows.
+            hands (list): Hand objects, e.g. Poker.hands.
+
+        Returns:
+            EventTable: The columnar table.
+        """
+        table = cls()
+        for i in rows:
+            table.add_row(i)
+        for h in hands:
+            table.add_hand(h)
+        return table
+
+    def _hand_index(self) -> np.ndarray:
+        """Index of each event's completed hand, -1 for rows of a hand that was never completed."""
+        e, h = self.events, self.hands
+        if not len(h['hand']):
+            return np.full(len(e['hand']), -1, dtype=np.int64)
+        hand_keys = (h['game'].astype(np.int64) << 32) | h['hand'].astype(np.int64)
+        event_keys = (e['game'].astype(np.int64) << 32) | e['hand'].astype(np.int64)
+        order = np.argsort(hand_keys, kind='stable')
+        ind = order[np.minimum(np.searchsorted(hand_keys[order], event_keys), len(order) - 1)]
+        return np.where(hand_keys[ind] == event_keys, ind, -1)
+
+    def running_total(self, grouped: Union[dict, IdentityResolver], dollar_amount: int = 100) -> dict:
+        """
+        Calculate the running total of dollars/chips won/lost based on buy-ins and cash-outs.
+
+        Args:
+            grouped (dict or IdentityResolver): Grouped names and ids.
+            dollar_amount (int): Chips per dollar.
+
+        Returns:
+            dict: A dictionary mapping player names to their net chip/dollar changes.
+        """
+        resolver = _as_resolver(grouped)
+        e, d = self.events, _group_name_blank(resolver.grouped, 0.0)
+        mask = (e['move'] >= 0) & (e['player'] >= 0) & (e['value'] != 0) & ~np.isnan(e['value'])
+        codes, first = np.unique(e['player'][mask], return_index=True)
+        names = {}
+        for code in codes:
+            names[code] = resolver.group(self.players[code], resolver.player_id(self.players[code]))
+        for code in codes[np.argsort(first)]:
+            if names[code] and names[code] not in d:
+                d[names[code]] = 0.0
+        sign = np.select([e['move'] == MOVE_CODES['Joined'],
+                          (e['move'] == MOVE_CODES['Stands']) | (e['move'] == MOVE_CODES['Quits'])], [-1.0, 1.0], 0.0)
+        totals = np.bincount(e['player'][mask], weights=(sign * e['value'])[mask], minlength=len(self.players))
+        for code in codes:
+            if names[code]:
+                d[names[code]] += totals[code]
+        return {k: round(float(v) / dollar_amount, 2) for k, v in d.items()}
+
+    def card_count(self) -> dict:
+        """
+        Calculate the frequency of each card drawn across the completed hands.
+
+        Returns:
+            dict: A dictionary mapping a card to its frequency count, sorted in descending order.
+        """
+        c = self.cards_table
+        hand = self._hand_index()[c['event']]
+        mask = hand >= 0
+        pairs = np.unique(hand[mask].astype(np.int64) * max(len(self.cards), 1) + c['card'][mask])
+        counts = np.bincount(pairs % max(len(self.cards), 1), minlength=len(self.cards))
+        dct = sorted([(int(v), self.cards[k]) for k, v in enumerate(counts) if v], reverse=True)
+        return {i[1]: i[0] for i in dct}
+
+    def player_stats(self, player_name: str, grouped: Union[dict, IdentityResolver]) -> dict:
+        """
+        Calculate specific statistics for a given player based on all completed hands.
+
+        Args:
+            player_name (str): A name from grouped.
+            grouped (dict or IdentityResolver): Grouped names and ids.
+
+        Returns:
+            dict: A dictionary of statistics including counts, averages, and extreme values.
+        """
+        e, h, s = self.events, self.hands, self.stacks
+        resolver = _as_resolver(grouped)
+        alias = np.array([player_name in resolver.groups(p) for p in self.players] + [False], dtype=bool)
+        rows = np.nonzero(alias[s['player']])[0][::-1]
+        # The last matching stack of a hand names the player, as in Poker.player_stats.
+        played, first = np.unique(s['hand'][rows], return_index=True)
+        rows = rows[first]
+        seat = np.full(len(h['hand']) + 1, -2, dtype=np.int64)
+        seat[played] = s['player'][rows]
+        change = s['ending'][rows] - s['starting'][rows]
+        change = change[~np.isnan(change) & (change <= 0)]
+
+        hand = self._hand_index()
+        mine = (seat[hand] == e['player']) & (hand >= 0)
+        stats = {'total_game_count': len(np.unique(h['game'][played])),
+                 'total_hand_count': len(played)}
+        win = np.nonzero(mine & (e['move'] == MOVE_CODES['Win']))[0]
+        win = win[np.unique(hand[win], return_index=True)[1]]
+        wins = e['value'][win].tolist()
+        stats['total_win_count'] = len(wins)
+        stats['total_win_amount'] = sum(wins)
+        stats['largest_win_amount'] = max(wins) if wins and max(wins) >= 0 else 0
+        stats['largest_loss_amount'] = float(change.min()) if len(change) else 0
+        for en in ('Bet', 'Call', 'Raise', 'Fold'):
+            v = e['action_amount'] if en == 'Fold' else e['value']
+            v = v[mine & (e['move'] == MOVE_CODES[en]) & (v != 0) & ~np.isnan(v)]
+            stats[f"average_{en.lower()}_amount"] = float(np.median(v)) if len(v) else None
+        stats['percent_win'] = percent(stats['total_win_count'], stats['total_hand_count'])
+        return stats
+
+    def _winners(self, grouped: Union[dict, IdentityResolver]) -> tuple:
+        """Grouped name code of each event's player (-1 if none) and whether that name won the event's hand."""
+        e, resolver = self.events, _as_resolver(grouped)
+        names = [resolver.group(p, p) for p in self.players]
+        name = np.append(np.unique(np.array(names, dtype=object), return_inverse=True)[1], -1)[e['player']]
+        hand = np.unique((e['game'].astype(np.int64) << 32) | (e['hand'].astype(np.int64) & 0xffffffff),
+                         return_inverse=True)[1]
+        n, won = max(len(names), 1), (e['move'] == MOVE_CODES['Win']) & (name >= 0)
+        return name, (name >= 0) & np.isin(hand * n + name, hand[won] * n + name[won])
+
+    def ts_analysis(self, grouped: Union[dict, IdentityResolver], rows: np.ndarray = None,
+                    window: int = 5) -> pd.DataFrame:
+        """
+        Build the time series of poker.analysis.ts_analysis with bincounts over the event columns.
+
+        Args:
+            grouped (dict or IdentityResolver): Grouped names and ids, a win counts for every id of the winner's name.
+            rows (np.ndarray): Positions of the events to use, e.g. DocumentFilter.row_index, all events when None.
+            window (int): Rolling window of the win percent.
+
+        Returns:
+            pd.DataFrame: One row per hand with a Call, Checks or Raise, keyed by hand start time.
+        """
+        e, win = self.events, self._winners(grouped)[1]
+        sel = np.arange(len(self), dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+        sel = sel[np.argsort(e['time'][sel], kind='stable')]
+        time, start, position, move = e['time'][sel], e['start'][sel], e['position'][sel], e['move'][sel]
+
+        # Per hand, the hand's last event.
+        starts, hand = np.unique(start, return_inverse=True)
+        last = len(sel) - 1 - np.unique(hand[::-1], return_index=True)[1]
+        cum = np.cumsum(np.append(0.0, win[sel][last]))
+        ind = np.arange(len(starts))
+        rolling = (cum[ind + 1] - cum[np.maximum(ind + 1 - window, 0)]) / np.minimum(ind + 1, window)
+        per_hand = {'Seconds per Hand': (time[last] - starts) / 1000,
+                    'Last Position in Hand': np.array([.25, .5, .75, 1.0, np.nan])[position[last]],
+                    'Rolling Win Percent': rolling,
+                    'Game Id': np.array(self.games + [None], dtype=object)[e['game'][sel][last]]}
+
+        # Hands with a Checks, Call or Raise, in order of their first one.
+        classes = ('Checks', 'Call', 'Raise')
+        m = np.isin(move, [MOVE_CODES[c] for c in classes])
+        first = np.unique(hand[m], return_index=True)
+        order = first[0][np.argsort(first[1])]
+        rank = np.empty(len(starts), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        n = len(order)
+        amount = np.nan_to_num(e['value'][sel][m])
+        pot, chips = e['pot'][sel][m], e['chips'][sel][m]
+        cls = np.select([move[m] == MOVE_CODES[c] for c in classes], [0, 1, 2])
+        key = rank[hand[m]] * len(POSITIONS) + position[m]
+
+        def mean(values: np.ndarray) -> np.ndarray:
+            ok = np.isfinite(values)
+            k = key[ok] * len(classes) + cls[ok]
+            total = np.bincount(k, weights=values[ok], minlength=n * 12)
+            count = np.bincount(k, minlength=n * 12)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return (total / np.where(count, count, np.nan)).reshape(n, 4, 3)
+
+        def columns(name: str, values: np.ndarray, short: bool = False) -> dict:
+            return {f"{name} {p} {c}": values[:, i, j] for j, c in enumerate(classes) if not short or j
+                    for i, p in enumerate(POSITIONS)}
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pot_per, chips_per = amount / (pot - amount), amount / (chips + amount)
+        final_dic = {'Start Time': starts[order].astype('datetime64[ms]').astype('datetime64[us]')}
+        bets = np.bincount(key, weights=amount, minlength=n * 4).reshape(n, 4)
+        final_dic.update({f"Position Bet {p}": bets[:, i] for i, p in enumerate(POSITIONS)})
+        count = np.bincount(key * len(classes) + cls, minlength=n * 12).reshape(n, 4, 3).astype(float)
+        final_dic.update(columns('Class Count', count))
+        final_dic.update(columns('Class Seconds', mean(e['seconds'][sel][m])))
+        final_dic.update(columns('Class Bet', mean(amount), True))
+        final_dic.update(columns('Class Bet Percent of Pot', mean(pot_per), True))
+        final_dic.update(columns('Class Bet Percent of Chips', mean(chips_per), True))
+        final_dic.update({k: v[order] for k, v in per_hand.items()})
+        return pd.DataFrame(final_dic)
@@ -2,9 +2,50 @@
 # pylint: disable=bad-plugin-value
 """
 """
+import sys
+from array import array
 from dataclasses import dataclass
 from poker.utils.class_functions import _get_attributes
-from poker.utils.tools import calc_gini, calculate_hand
+from poker.utils.tools import calc_gini, calculate_hand, DECK, CARD_CODES
+
+
+def _win_hand(table_cards: dict) -> str:
+    """Calculates the winning hand from the winner's and the board cards."""
+    cards = []
+    for i in ('winner', 'flop', 'turn', 'river'):
+        if table_cards.get(i):
+            cards.extend(table_cards[i])
+    return calculate_hand(set(cards))
+
+
+def _place_undealt(table_cards: dict) -> dict:
+    """Dedupes the winner's cards and moves undealt cards onto the turn/river/flop they would have been."""
+    table_cards['winner'] = list(dict.fromkeys(table_cards['winner']))
+    undealt = table_cards.get('undealt')
+    if undealt:
+        if len(undealt) == 1:
+            table_cards['river'] = undealt
+        elif len(undealt) == 2:
+            table_cards['turn'], table_cards['river'] = [undealt[0]], [undealt[1]]
+        elif len(undealt) == 5:
+            table_cards['flop'], table_cards['turn'], table_cards['river'] = undealt[:3], [undealt[-2]], [undealt[-1]]
+    return table_cards
+
+
+def _pack_cards(cards: list):
+    """Cards as one byte per card, or a tuple of the strings when a card is not in the deck."""
+    try:
+        return bytes(CARD_CODES[c] for c in cards)
+    except KeyError:
+        return tuple(cards)
+
+
+def _unpack_cards(cards) -> list:
+    return [DECK[c] for c in cards] if isinstance(cards, bytes) else list(cards)
+
+
+def _pack_chips(chips: dict) -> tuple:
+    return tuple(sys.intern(k) for k in chips), array('d', chips.values())
 
 
 @dataclass
@@ -33,14 +74,7 @@ class Hand:
         self.event_dct = d['event_dct']
         self.game_id = d['game_id']
         self.winner = d['winner']
-        self.win_hand = d['win_hand']
-        # Calculates winning hand if not given.
-        if not self.win_hand:
-            cards = []
-            for i in ('winner', 'flop', 'turn', 'river'):
-                if d['table_cards'].get(i):
-                    cards.extend(d['table_cards'][i])
-            self.win_hand = calculate_hand(set(cards))
+        self.win_hand = d['win_hand'] if d['win_hand'] else _win_hand(d['table_cards'])
         self.win_stack = d['win_stack']
         self.win_cards = d['win_cards']
         self.hand_time = d['hand_time']
@@ -52,29 +86,17 @@ class Hand:
         self.ending_players = d['ending_players']
         self.position = d['position']
         self.all_cards = d['all_cards']
-        self.table_cards = d['table_cards']
-        self.table_cards['winner'] = list(set(self.table_cards['winner']))
+        self.table_cards = _place_undealt(d['table_cards'])
         self.pot_size = d['pot_size']
         self.total_chips = d['total_chips']
         self.start_gini = calc_gini(list(d['starting_chips'].values()))
         self.end_gini = calc_gini(list(d['ending_chips'].values()))
         self.joined = d['joined']
-        self.flop = d['table_cards'].get('flop')
-        self.turn = d['table_cards'].get('turn')
-        self.river = d['table_cards'].get('river')
-        self.undealt = d['table_cards'].get('undealt')
-        # Place undealt cards.
-        if self.undealt:
-            if len(self.undealt) == 1:
-                self.table_cards['river'], self.river = self.undealt, self.undealt
-            elif len(self.undealt) == 2:
-                self.table_cards['turn'], self.turn = [self.undealt[0]], [self.undealt[0]]
-                self.table_cards['river'], self.river = [self.undealt[1]], [self.undealt[1]]
-            elif len(self.undealt) == 5:
-                self.table_cards['flop'], self.flop = self.undealt[:3], self.undealt[:3]
-                self.table_cards['turn'], self.turn = [self.undealt[-2]], [self.undealt[-2]]
-                self.table_cards['river'], self.river = [self.undealt[-1]], [self.undealt[-1]]
-        self.mycards = d['table_cards'].get('your_cards')
+        self.flop = self.table_cards.get('flop')
+        self.turn = self.table_cards.get('turn')
+        self.river = self.table_cards.get('river')
+        self.undealt = self.table_cards.get('undealt')
+        self.mycards = self.table_cards.get('your_cards')
 
     def __repr__(self):
         return f"Game: ({self.game_id}), Hand: ({self.hand_number})"
@@ -87,3 +109,143 @@ class Hand:
             dict: The attributes of the Hand object.
         """
         return _get_attributes(self)
+
+
+@dataclass
+class CompactHand:
+    """
+    A slotted, memory light version of Hand.
+
+    Cards are stored one byte per card, player strings are interned and chip counts live in arrays.
+    Rows are not copied, event_lst and event_dct are views of the hand's slice of the parsed rows.
+
+    Attributes:
+        game_id (str): Game identifier.
+        hand_number (int): Unique identifier for the hand within the game.
+        winner (list): The winner of the hand.
+        pot_size (float): The final pot size.
+        table_cards (dict): Community cards and player cards.
+
+    Methods:
+        items(): Return the attributes of the hand.
+    """
+    __slots__ = ('game_id', 'hand_number', 'start_time', 'end_time', 'position', 'pot_size', 'total_chips',
+                 'win_stack', 'win_hand', 'start_gini', 'end_gini', '_winner', '_joined', '_ending_players',
+                 '_starting', '_ending', '_cards', '_win_cards', '_all_cards', '_rows', '_start', '_stop')
+
+    def __init__(self, d: dict, rows: list):
+        """
+        Initialize a CompactHand instance.
+
+        Args:
+            d (dict): A dictionary containing parsed data for a single hand.
+            rows (list): The parsed rows of the log, ending with this hand's rows.
+        """
+        self.game_id = d['game_id']
+        self.hand_number = d['hand_number']
+        self.start_time = d['start_time']
+        self.end_time = d['end_time']
+        self.position = d['position']
+        self.pot_size = d['pot_size']
+        self.total_chips = d['total_chips']
+        self.win_stack = d['win_stack']
+        self.win_hand = d['win_hand'] if d['win_hand'] else _win_hand(d['table_cards'])
+        self.start_gini = calc_gini(list(d['starting_chips'].values()))
+        self.end_gini = calc_gini(list(d['ending_chips'].values()))
+        self._winner = tuple(sys.intern(i) for i in d['winner'])
+        self._joined = tuple(sys.intern(i) for i in d['joined'])
+        self._ending_players = tuple(sys.intern(i) for i in d['ending_players'])
+        self._starting = _pack_chips(d['starting_chips'])
+        self._ending = _pack_chips(d['ending_chips'])
+        self._cards = tuple((sys.intern(k), _pack_cards(v)) for k, v in _place_undealt(d['table_cards']).items())
+        self._win_cards = _pack_cards(d['win_cards'])
+        self._all_cards = _pack_cards(d['all_cards'])
+        self._rows = rows
+        self._stop = len(rows)
+        self._start = self._stop - len(d['event_lst'])
+
+    def __repr__(self):
+        return f"Game: ({self.game_id}), Hand: ({self.hand_number})"
+
+    @property
+    def event_lst(self) -> list:
+        return self._rows[self._start:self._stop]
+
+    @property
+    def event_dct(self) -> dict:
+        dct = {}
+        for i in self._rows[self._start:self._stop]:
+            if i.get('move'):
+                dct.setdefault(i['move'], []).append(i)
+        return dct
+
+    @property
+    def hand_time(self):
+        return self.end_time - self.start_time
+
+    @property
+    def winner(self) -> list:
+        return list(self._winner)
+
+    @property
+    def joined(self) -> list:
+        return list(self._joined)
+
+    @property
+    def ending_players(self) -> list:
+        return list(self._ending_players)
+
+    @property
+    def starting_chips(self) -> dict:
+        return dict(zip(*self._starting))
+
+    @property
+    def ending_chips(self) -> dict:
+        return dict(zip(*self._ending))
+
+    @property
+    def table_cards(self) -> dict:
+        return {k: _unpack_cards(v) for k, v in self._cards}
+
+    @property
+    def win_cards(self) -> list:
+        return _unpack_cards(self._win_cards)
+
+    @property
+    def all_cards(self) -> list:
+        return _unpack_cards(self._all_cards)
+
+    @property
+    def flop(self):
+        return self._table_card('flop')
+
+    @property
+    def turn(self):
+        return self._table_card('turn')
+
+    @property
+    def river(self):
+        return self._table_card('river')
+
+    @property
+    def undealt(self):
+        return self._table_card('undealt')
+
+    @property
+    def mycards(self):
+        return self._table_card('your_cards')
+
+    def _table_card(self, key: str):
+        for k, v in self._cards:
+            if k == key:
+                return _unpack_cards(v)
+        return None
+
+    def items(self):
+        """
+        Return the attributes of the hand.
+
+        Returns:
+            dict: The attributes of the CompactHand object.
+        """
+        return _get_attributes(self)
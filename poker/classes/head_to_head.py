@@ -0,0 +1,154 @@
+"""
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Union
+import numpy as np
+import pandas as pd
+from poker.utils.class_functions import _get_attributes
+from poker.classes.resolver import IdentityResolver, _as_resolver
+
+MOVES = ('Call', 'Raise', 'Checks', 'Fold')
+
+
+@dataclass
+class HeadToHead:
+    """
+    Sparse counts and amounts of each move a player made against the player who last bet or raised.
+
+    Only the (player, from_player, move) triples that occur are stored, so memory grows with the rows
+    and not with the square of the number of players.
+
+    Attributes:
+        players (list): Player names, grouped names when known else the full player string, indexed by code.
+        moves (list): Moves tracked, indexed by code.
+        keys (np.ndarray): Sorted (player, from_player, move) triples as codes, shape (n, 3).
+        count (np.ndarray): Number of moves per triple.
+        sum (np.ndarray): Total amount per triple.
+
+    Methods:
+        items(): Return the attributes of the class.
+        update(): Add parsed rows.
+        mean(): Mean amount per triple.
+        median(): Median amount per triple.
+        to_frame(): The triples with their count, sum, mean and median.
+    """
+    def __init__(self, rows: list = None, grouped: Union[dict, IdentityResolver] = None, moves: tuple = MOVES):
+        """
+        Initialize a HeadToHead instance.
+
+        Args:
+            rows (list): Parsed rows, e.g. Poker.rows or DocumentFilter.rows.
+            grouped (dict or IdentityResolver): Grouped names and ids, used to name players.
+            moves (tuple): Moves to track, Call, Raise, Checks and Fold by default.
+        """
+        self.players, self.moves = [], list(moves)
+        self._resolver = _as_resolver(grouped)
+        self._codes, self._move_codes = {}, {m: c for c, m in enumerate(moves)}
+        self._buffers = {'player': array('i'), 'from_player': array('i'), 'move': array('b'), 'value': array('d')}
+        self._summary = None
+        if rows:
+            self.update(rows)
+
+    def __repr__(self) -> str:
+        return f"Players: ({len(self.players)}), Rows: ({len(self._buffers['move'])})"
+
+    def items(self):
+        """
+        Return the attributes of the class.
+
+        Returns:
+            dict: The attributes of the HeadToHead object.
+        """
+        return _get_attributes(self)
+
+    def _code(self, player: str) -> int:
+        if player not in self._codes:
+            name = self._resolver.group(player, player)
+            if name not in self._codes:
+                self._codes[name] = len(self.players)
+                self.players.append(name)
+            self._codes[player] = self._codes[name]
+        return self._codes[player]
+
+    def update(self, rows: list) -> None:
+        """
+        Add parsed rows, rows of other moves or without a player to answer are skipped.
+
+        Args:
+            rows (list): Parsed rows, e.g. one file's rows from iter_parser.
+        """
+        b = self._buffers
+        for i in rows:
+            move = self._move_codes.get(i.get('move'))
+            if move is None or i.get('player') is None or i.get('actionFrom') is None:
+                continue
+            player, from_player = self._code(i['player']), self._code(i['actionFrom'])
+            if player == from_player:
+                continue
+            value = i.get('actionAmount') if i['move'] == 'Fold' else i.get('value')
+            b['player'].append(player)
+            b['from_player'].append(from_player)
+            b['move'].append(move)
+            b['value'].append(value if value is not None else 0.0)
+        self._summary = None
+
+    def _summarize(self) -> dict:
+        """Sort the rows by triple, once per update."""
+        if self._summary is None:
+            b = {k: np.frombuffer(v, dtype=v.typecode) for k, v in self._buffers.items()}
+            n, m = max(len(self.players), 1), max(len(self.moves), 1)
+            key = (b['player'].astype(np.int64) * n + b['from_player']) * m + b['move']
+            order = np.lexsort((b['value'], key))
+            key, values = key[order], b['value'][order]
+            uniq, start = np.unique(key, return_index=True)
+            self._summary = {'keys': np.stack([uniq // m // n, uniq // m % n, uniq % m], axis=1),
+                             'start': start, 'count': np.diff(np.append(start, len(key))),
+                             'sum': np.add.reduceat(values, start) if len(start) else np.zeros(0), 'values': values}
+        return self._summary
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._summarize()['keys']
+
+    @property
+    def count(self) -> np.ndarray:
+        return self._summarize()['count']
+
+    @property
+    def sum(self) -> np.ndarray:
+        return self._summarize()['sum']
+
+    def mean(self) -> np.ndarray:
+        """
+        Mean amount per triple.
+
+        Returns:
+            np.ndarray: Aligned with keys.
+        """
+        s = self._summarize()
+        return s['sum'] / s['count']
+
+    def median(self) -> np.ndarray:
+        """
+        Median amount per triple, read from the rows sorted by amount within each triple.
+
+        Returns:
+            np.ndarray: Aligned with keys.
+        """
+        s = self._summarize()
+        lo, hi = s['start'] + (s['count'] - 1) // 2, s['start'] + s['count'] // 2
+        return (s['values'][lo] + s['values'][hi]) / 2
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The triples with their count, sum, mean and median.
+
+        Returns:
+            pd.DataFrame: Indexed by (player, from_player, move).
+        """
+        keys, players, moves = self.keys, np.array(self.players, dtype=object), np.array(self.moves, dtype=object)
+        index = pd.MultiIndex.from_arrays([players[keys[:, 0]], players[keys[:, 1]], moves[keys[:, 2]]],
+                                          names=['player', 'from_player', 'move'])
+        return pd.DataFrame({'Count': self.count, 'Sum': self.sum, 'Mean': self.mean(), 'Median': self.median()},
+                            index=index)
@@ -1,9 +1,18 @@
 """
 """
+from collections import OrderedDict
 from dataclasses import dataclass
-from poker.utils.functions import parse_games
-from poker.utils.class_functions import _get_attributes, _clean_print, _flatten_group, _group_name_blank
-from poker.utils.tools import percent, native_median
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from poker.utils.functions import parse_games, log_files
+from poker.classes.events import EventTable
+from poker.classes.document_filter import DocumentFilter
+from poker.classes.resolver import IdentityResolver
+from poker.utils.class_functions import _get_attributes, _clean_print, _group_name_blank, _index_players, _memoize, \
+    _game_spans, _truncate_index
+from poker.utils.tools import percent, native_median, hand_equity
 
 
 @dataclass
@@ -17,12 +26,20 @@ class Poker:
         grouped (dict): A dictionary mapping player names to their possible identifiers.
         rows (list): A list of parsed log rows representing individual actions.
         hands (list): A list of Hand objects representing individual games played.
+        events (EventTable): Columnar copy of rows and hands, when 'columnar' is set, otherwise None.
+            It is kept next to rows and hands, so it costs memory rather than saving it.
+        resolver (IdentityResolver): Resolves player strings to grouped names, shared by the stats.
 
     Methods:
         items(): Return the attributes of the class.
         running_total(): Calculate the running total of chips for each player.
         card_count(): Calculate the frequency of cards drawn.
         player_stats(): Calculate specific statistics for a player.
+        all_player_stats(): Calculate player_stats for every grouped player at once.
+        equity(): Calculate the user's equity on each street of every hand.
+        cache_info(): Return the hit/miss counts of the memoized stats.
+        clear_cache(): Empty the memoized stats.
+        refresh(): Parse new or changed log files in the repo.
     """
     def __init__(self, user_inputs: dict):
         """
@@ -30,18 +47,35 @@ class Poker:
 
         Args:
             user_inputs (dict): A dictionary containing user configurations, including 'me', 'repo', and 'grouped'.
+                Optional 'workers' (int) parses the log files in a process pool of that size.
+                Optional 'cache' (str) is a directory where parsed files are kept between runs.
+                Optional 'compact' (bool) stores hands as CompactHands, which share the rows instead of copying them.
+                Optional 'columnar' (bool) also builds an EventTable that backs the vectorized stats. This is for
+                    speed only, rows and hands are still kept. Use parse_table to load an EventTable without them.
+                Optional 'memo_size' (int) is how many stats results are memoized, 128 by default, 0 turns it off.
+                Optional 'lookup' (dict) is the output of get_player_lookup, kept by the resolver.
         """
         self.user = user_inputs.get('me')
         self.repo = user_inputs.get('repo')
         self.grouped = user_inputs.get('grouped')
         self._line_limit = user_inputs.get('line_limit', 50)
         self._item_limit = user_inputs.get('item_limit', 10)
+        self._workers = user_inputs.get('workers')
+        self._cache = user_inputs.get('cache')
+        self._compact = user_inputs.get('compact', False)
+        self._memo = {'entries': OrderedDict(), 'max_size': user_inputs.get('memo_size', 128), 'state': None,
+                      'hits': 0, 'misses': 0, 'evictions': 0}
         self._inputs = list(user_inputs.values())
-        self._flat_group_id_name = _flatten_group(self.grouped)
+        self.resolver = IdentityResolver(self.grouped, user_inputs.get('lookup'))
         assert self.user is not None
         assert self.repo is not None
         assert self.grouped is not None
-        self.rows, self.hands = parse_games(self.repo, self.user, self.grouped)
+        self._files = log_files(self.repo)
+        self.rows, self.hands = parse_games(self.repo, self.user, self.grouped, self._workers, self._cache,
+                                             compact=self._compact)
+        self.events = EventTable.from_rows(self.rows, self.hands) if user_inputs.get('columnar') else None
+        self._index = _index_players(self.hands, self.rows, self.resolver)
+        self._spans = _game_spans(self.rows, self.hands)
 
 
     def __str__(self) -> str:
@@ -72,19 +106,94 @@ class Poker:
         return _get_attributes(self)
 
 
+    def refresh(self) -> int:
+        """
+        Parse only the log files that were added, changed or removed since the last load.
+
+        New files are parsed and appended. The rows and hands of a changed or removed file are cut out, along with
+        their events and index entries, and the games loaded after it move up. A changed file is parsed again and
+        appended, so a log that keeps growing during a game ends up last and later refreshes only touch its rows.
+
+        Returns:
+            int: The number of rows added.
+        """
+        current = log_files(self.repo)
+        changed = [f for f, stat in current.items() if self._files.get(f) != stat]
+        stale = {f for f in self._files if f not in current or f in changed}
+        order = list(self._spans)
+        first = min((order.index(g) for g in stale if g in self._spans), default=len(order))
+        row_cut, hand_cut = (self._spans[order[first]][0], self._spans[order[first]][2]) if first < len(order) \
+            else (len(self.rows), len(self.hands))
+        tail_rows, tail_hands = [], []
+        if first < len(order):
+            kept = [g for g in order[first:] if g not in stale]
+            for g in kept:
+                r0, r1, h0, h1 = self._spans[g]
+                tail_rows.extend(self.rows[r0:r1])
+                tail_hands.extend(self.hands[h0:h1])
+            for g in order[first:]:
+                del self._spans[g]
+            self.rows = self.rows[:row_cut] + tail_rows
+            self.hands = self.hands[:hand_cut] + tail_hands
+            _game_spans(tail_rows, tail_hands, self._spans, row_cut, hand_cut)
+            _truncate_index(self._index, row_cut, hand_cut)
+            if self.events is not None:
+                self.events.truncate(row_cut, hand_cut)
+        rows, hands = [], []
+        if changed:
+            rows, hands = parse_games(self.repo, self.user, self.grouped, self._workers, self._cache, changed,
+                                       self._compact)
+            _game_spans(rows, hands, self._spans, len(self.rows), len(self.hands))
+            self.rows.extend(rows)
+            self.hands.extend(hands)
+        if self.events is not None:
+            self.events.extend(EventTable.from_rows(tail_rows + rows, tail_hands + hands))
+        _index_players(tail_hands + hands, tail_rows + rows, self.resolver, self._index)
+        self._files = current
+        self.clear_cache()
+        return len(rows)
+
+
+    def cache_info(self) -> dict:
+        """
+        Return the hit/miss counts of the memoized stats.
+
+        Returns:
+            dict: hits, misses, evictions, the current size and the max_size of the cache.
+        """
+        return {'hits': self._memo['hits'], 'misses': self._memo['misses'], 'evictions': self._memo['evictions'],
+                'size': len(self._memo['entries']), 'max_size': self._memo['max_size']}
+
+
+    def clear_cache(self) -> None:
+        """
+        Empty the memoized stats, e.g. after editing rows or hands in place.
+        """
+        self._memo['entries'].clear()
+
+
+    @_memoize
     def running_total(self, rows: list = None, dollar_amount: int = 100,) -> dict:
         """
         Calculate the running total of dollars/chips won/lost based on buy-ins and cash-outs.
 
+        Args:
+            rows (list or DocumentFilter): Rows to total, all rows when None.
+            dollar_amount (int): Chips per dollar.
+
         Returns:
             dict: A dictionary mapping player names to their net chip/dollar changes.
         """
+        if isinstance(rows, DocumentFilter):
+            rows = rows.rows
+        if rows is None and self.events is not None:
+            return self.events.running_total(self.resolver, dollar_amount)
         d = _group_name_blank(self.grouped, 0.0)
-        if not rows:
+        if rows is None:
             rows = self.rows
         for i in rows:
             if i.get('move') and i.get('value') and i.get('playerId'):
-                n = self._flat_group_id_name.get(i['playerId'], i['playerId'])
+                n = self.resolver.group(i['player'], i['playerId'])
                 if n:
                     if n not in d:
                         d[n] = 0.0
@@ -95,14 +204,22 @@ class Poker:
         return {k: round(v / dollar_amount, 2) for k, v in d.items()}
 
 
+    @_memoize
     def card_count(self, rows: list = None) -> dict:
         """
         Calculate the frequency of each card drawn across the provided hands/rows.
 
+        Args:
+            rows (list or DocumentFilter): Rows with cards, or a filter whose hands are counted. All hands when None.
+
         Returns:
             dict: A dictionary mapping a card to its frequency count, sorted in descending order.
         """
-        if not rows:
+        if isinstance(rows, DocumentFilter):
+            rows = [{'cards': set(i.all_cards)} for i in rows.hands]
+        if rows is None and self.events is not None:
+            return self.events.card_count()
+        if rows is None:
             rows = [{'cards': set(i.all_cards)} for i in self.hands]
         dct = {}
         for i in rows:
@@ -115,15 +232,22 @@ class Poker:
         return {i[1]: i[0] for i in dct}
 
 
-    def player_stats(self, player_name: str) -> dict:
+    @_memoize
+    def player_stats(self, player_name: str, data: DocumentFilter = None) -> dict:
         """
         Calculate specific statistics for a given player based on all hands played.
 
+        Args:
+            player_name (str): A name from grouped.
+            data (DocumentFilter): Only count the filter's hands, all hands when None.
+
         Returns:
             dict: A dictionary of statistics including counts, averages, and extreme values.
         """
         assert player_name in self.grouped
         assert isinstance(self.grouped[player_name], tuple)
+        if self.events is not None and data is None:
+            return self.events.player_stats(player_name, self.resolver)
         stats = {'total_game_count': set(),
                  'total_hand_count': 0,
                  'total_win_count': 0,
@@ -136,15 +260,10 @@ class Poker:
                  'average_fold_amount': []}
         # How long has the player played.
         # Cards shown
-        for h in self.hands:
-            p = None
-            if hasattr(h, 'starting_chips'):
-                for k, v in h.starting_chips.items():
-                    for a in self.grouped[player_name]:
-                        if k.endswith(a):
-                            p = k
-                            break
-            if p:
+        keep = set(data.hand_index.tolist()) if data is not None else None
+        for ind, p in self._index['hands'][player_name]:
+            h = self.hands[ind]
+            if p and (keep is None or ind in keep):
                 # Total Hand Count.
                 stats['total_hand_count'] += 1
                 if h.game_id not in stats['total_game_count']:
@@ -183,3 +302,97 @@ class Poker:
         stats['percent_win'] = percent(stats['total_win_count'], stats['total_hand_count'])
         stats['total_game_count'] = len(stats['total_game_count'])
         return stats
+
+
+    @_memoize
+    def all_player_stats(self, data: DocumentFilter = None) -> pd.DataFrame:
+        """
+        Calculate player_stats for every player in grouped, in one pass over their hands.
+
+        Args:
+            data (DocumentFilter): Only count the filter's hands, all hands when None.
+
+        Returns:
+            pd.DataFrame: One row per player, with the player_stats keys as columns.
+        """
+        if self.events is not None and data is None:
+            return pd.DataFrame.from_dict({n: self.events.player_stats(n, self.resolver) for n in self.grouped},
+                                          orient='index')
+        seats, keep = {}, set(data.hand_index.tolist()) if data is not None else None
+        for name, lst in self._index['hands'].items():
+            for ind, p in lst:
+                if keep is None or ind in keep:
+                    seats.setdefault(ind, []).append((name, p))
+        hand_rows, event_rows, win_rows = [], [], []
+        for ind in sorted(seats):
+            h = self.hands[ind]
+            events, wins = {}, {}
+            for en, lst in h.event_dct.items():
+                if en in ('Bet', 'Call', 'Raise', 'Fold'):
+                    key = 'value' if en != 'Fold' else 'actionAmount'
+                    for e in lst:
+                        if e.get(key):
+                            events.setdefault(e['player'], []).append((en, e[key]))
+                elif en == 'Win':
+                    for e in lst:
+                        wins.setdefault(e['player'], e['value'])
+            for name, p in seats[ind]:
+                if not p:
+                    continue
+                change = h.ending_chips[p] - h.starting_chips[p] if p in h.ending_chips else np.nan
+                hand_rows.append((name, h.game_id, change))
+                event_rows.extend((name, en, v) for en, v in events.get(p, []))
+                if p in wins:
+                    win_rows.append((name, wins[p]))
+
+        hands = pd.DataFrame(hand_rows, columns=['player', 'game_id', 'change']).groupby('player')
+        events = pd.DataFrame(event_rows, columns=['player', 'move', 'amount']).groupby(['player', 'move'])['amount']
+        wins = pd.DataFrame(win_rows, columns=['player', 'value']).groupby('player')['value']
+        games, count = hands['game_id'].nunique(), hands.size()
+        loss = hands['change'].min().fillna(0).clip(upper=0)
+        medians, win_count, win_amount, win_max = events.median(), wins.size(), wins.sum(), wins.max().clip(lower=0)
+
+        d = {}
+        for name in self.grouped:
+            stats = {'total_game_count': int(games.get(name, 0)),
+                     'total_hand_count': int(count.get(name, 0)),
+                     'total_win_count': int(win_count.get(name, 0)),
+                     'total_win_amount': float(win_amount.get(name, 0)),
+                     'largest_win_amount': float(win_max.get(name, 0)),
+                     'largest_loss_amount': float(loss.get(name, 0))}
+            for en in ('Bet', 'Call', 'Raise', 'Fold'):
+                stats[f"average_{en.lower()}_amount"] = float(medians[(name, en)]) if (name, en) in medians.index else None
+            stats['percent_win'] = percent(stats['total_win_count'], stats['total_hand_count'])
+            d[name] = stats
+        return pd.DataFrame.from_dict(d, orient='index')
+
+
+    def equity(self, opponents: int = None, samples: int = 10000, seed: int = None, exact: bool = None,
+               max_exact: int = 100000, workers: int = None, data: DocumentFilter = None) -> list:
+        """
+        Calculate the user's equity on each street of every hand where their cards are known.
+
+        Args:
+            opponents (int): Number of random opponent hands, defaults to the other players dealt in.
+            samples (int): Monte Carlo deals per street.
+            seed (int): Seed for reproducible results, each hand gets its own child seed.
+            exact (bool): Enumerate every deal (True), sample (False) or enumerate when small (None).
+            max_exact (int): Largest number of deals enumerated when exact is None.
+            workers (int): Process pool size, defaults to the 'workers' option.
+            data (DocumentFilter): Only use the filter's hands, all hands when None.
+
+        Returns:
+            list: One dict per hand, with game_id, hand_number and the equity at each position.
+        """
+        hands = [h for h in (data.hands if data is not None else self.hands) if h.mycards and len(h.mycards) == 2]
+        board = [(h.flop or []) + (h.turn or []) + (h.river or []) for h in hands]
+        opp = [opponents or max(len(h.starting_chips) - 1, 1) for h in hands]
+        seeds = np.random.SeedSequence(seed).spawn(len(hands))
+        args = ([h.mycards for h in hands], board, opp, repeat(samples), seeds, repeat(exact), repeat(max_exact))
+        workers = workers or self._workers
+        if workers and workers > 1 and len(hands) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(hand_equity, *args, chunksize=max(1, len(hands) // (workers * 4))))
+        else:
+            results = list(map(hand_equity, *args))
+        return [{'game_id': h.game_id, 'hand_number': h.hand_number, **r} for h, r in zip(hands, results)]
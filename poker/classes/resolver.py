@@ -0,0 +1,147 @@
+"""
+"""
+import sys
+from dataclasses import dataclass
+from typing import Union
+from poker.utils.class_functions import _get_attributes
+
+
+@dataclass
+class IdentityResolver:
+    """
+    Resolves "Name @ ID" player strings to integer codes, ids, display names and grouped names.
+
+    Each player string is split and matched against grouped once, later lookups are a single dict access.
+
+    Attributes:
+        grouped (dict): Grouped names, followed by a tuple of their ids.
+        players (list): Interned player strings, indexed by player code.
+        known_names (dict): Display names seen per id, or per grouped name, from get_player_lookup.
+
+    Methods:
+        items(): Return the attributes of the class.
+        code(): Player code of a player string.
+        player(): The interned player string.
+        player_id(): Id of a player string.
+        player_name(): Display name of a player string.
+        group(): Grouped name of a player string.
+        groups(): Every grouped name claiming a player string's id.
+    """
+    def __init__(self, grouped: dict = None, lookup: dict = None):
+        """
+        Initialize an IdentityResolver instance.
+
+        Args:
+            grouped (dict): Grouped names, followed by a tuple of their ids.
+            lookup (dict): Output of get_player_lookup, with or without grouped, kept as known_names.
+        """
+        self.grouped = grouped if grouped else {}
+        self.players, self.known_names = [], {}
+        self._ids, self._info = {}, {}
+        for name, ids in self.grouped.items():
+            for i in ids:
+                self._ids[i] = self._ids.get(i, ()) + (name,)
+        for k, v in (lookup or {}).items():
+            self.known_names[k] = list(v['names']) if isinstance(v, dict) else list(v)
+
+    def __repr__(self) -> str:
+        return f"Grouped: ({len(self.grouped)}), Players: ({len(self.players)})"
+
+    def items(self):
+        """
+        Return the attributes of the class.
+
+        Returns:
+            dict: The attributes of the IdentityResolver object.
+        """
+        return _get_attributes(self)
+
+    def _resolve(self, player: str) -> tuple:
+        info = self._info.get(player)
+        if info is None:
+            player = sys.intern(player)
+            parts = player.split('@')
+            pid = parts[1].strip() if len(parts) > 1 else None
+            info = (len(self.players), player, pid, parts[0].strip(), self._ids.get(pid, ()))
+            self.players.append(player)
+            self._info[player] = info
+        return info
+
+    def code(self, player: str) -> int:
+        """
+        Player code of a player string, new strings get the next code.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+
+        Returns:
+            int: Index of the string in players.
+        """
+        return self._resolve(player)[0]
+
+    def player(self, player: str) -> str:
+        """
+        The interned player string, equal to the input.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+
+        Returns:
+            str: The one copy of the string kept by the resolver.
+        """
+        return self._resolve(player)[1]
+
+    def player_id(self, player: str) -> Union[str, None]:
+        """
+        Id of a player string, as get_player_id.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+
+        Returns:
+            str: The id, None when there is no '@'.
+        """
+        return self._resolve(player)[2]
+
+    def player_name(self, player: str) -> str:
+        """
+        Display name of a player string, as get_player_name.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+
+        Returns:
+            str: The display name.
+        """
+        return self._resolve(player)[3]
+
+    def group(self, player: str, default=None):
+        """
+        Grouped name of a player string, the last one in grouped when several claim its id.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+            default: Returned when no grouped name claims the id.
+
+        Returns:
+            str: The grouped name, else default.
+        """
+        groups = self._resolve(player)[4]
+        return groups[-1] if groups else default
+
+    def groups(self, player: str) -> tuple:
+        """
+        Every grouped name claiming the id of a player string.
+
+        Args:
+            player (str): A "Name @ ID" player string.
+
+        Returns:
+            tuple: Grouped names, empty when the id is unknown.
+        """
+        return self._resolve(player)[4]
+
+
+def _as_resolver(grouped: Union[dict, IdentityResolver]) -> IdentityResolver:
+    """Returns grouped when it is already a resolver, else a resolver built from it."""
+    return grouped if isinstance(grouped, IdentityResolver) else IdentityResolver(grouped)
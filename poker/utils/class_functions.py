@@ -1,5 +1,12 @@
 """
 """
+import copy
+import functools
+from bisect import bisect_left
+from itertools import groupby
+from operator import itemgetter, attrgetter
+
+
 def _clean_print(o, line_lim: int, item_lim: int, new_line: bool = True) -> str:
     """
     Controls what is displayed when a class is called.
@@ -103,6 +110,177 @@ def _group_name_blank(d: dict, val) -> dict:
         return {}
 
 
+def _index_players(hands: list, rows: list, resolver, index: dict = None) -> dict:
+    """
+    Returns an index of hands and rows per grouped player name.
+
+    Parameters
+    ----------
+    hands : list.
+        Hand objects, appended after any hands already indexed.
+    rows : list.
+        Parsed rows, appended after any rows already indexed.
+    resolver : IdentityResolver.
+        Resolves player strings to the grouped names claiming their id.
+    index : dict.
+        An index to extend, a new one is built when None.
+
+    Returns
+    -------
+    dict
+        Returns 'hands' (name -> (hand index, player) pairs) and 'rows' (name -> row indexes).
+    """
+    if index is None:
+        index = {'hands': {k: [] for k in resolver.grouped}, 'rows': {k: [] for k in resolver.grouped},
+                 'hand_count': 0, 'row_count': 0}
+    match = resolver.groups
+
+    for ind, h in enumerate(hands, index['hand_count']):
+        last = {}
+        for k in h.starting_chips:
+            for n in match(k):
+                last[n] = k
+        for n, k in last.items():
+            index['hands'][n].append((ind, k))
+    for ind, i in enumerate(rows, index['row_count']):
+        if i.get('player'):
+            for n in match(i['player']):
+                index['rows'][n].append(ind)
+    index['hand_count'] += len(hands)
+    index['row_count'] += len(rows)
+    return index
+
+
+def _truncate_index(index: dict, rows: int, hands: int) -> dict:
+    """
+    Drops the rows and hands from the given positions on out of an index built by _index_players.
+
+    Parameters
+    ----------
+    index : dict.
+        An index built by _index_players.
+    rows : int.
+        Number of rows kept.
+    hands : int.
+        Number of hands kept.
+
+    Returns
+    -------
+    dict
+        Returns the index, changed in place, ready to be extended from those positions.
+
+    Notes
+    -----
+    The indexes are appended in order, so each list is cut at a bisection rather than scanned.
+    """
+    for lst in index['rows'].values():
+        del lst[bisect_left(lst, rows):]
+    for lst in index['hands'].values():
+        del lst[bisect_left(lst, (hands,)):]
+    index['row_count'], index['hand_count'] = rows, hands
+    return index
+
+
+def _game_spans(rows: list, hands: list, spans: dict = None, row_start: int = 0, hand_start: int = 0) -> dict:
+    """
+    Returns the positions of each game's rows and hands.
+
+    Parameters
+    ----------
+    rows : list.
+        Parsed rows, each game's rows next to each other as parse_games returns them.
+    hands : list.
+        Hand objects, in the same game order as rows.
+    spans : dict.
+        Spans to extend, a new dict is built when None.
+    row_start : int.
+        Position of the first row.
+    hand_start : int.
+        Position of the first hand.
+
+    Returns
+    -------
+    dict
+        Returns game_id -> [first row, row stop, first hand, hand stop], in the order of the rows.
+    """
+    spans = {} if spans is None else spans
+    added, r = [], row_start
+    for game, group in groupby(rows, key=itemgetter('game_id')):
+        n = len(list(group))
+        spans[game] = [r, r + n, None, None]
+        added.append(game)
+        r += n
+    h = hand_start
+    for game, group in groupby(hands, key=attrgetter('game_id')):
+        n = len(list(group))
+        spans[game][2:] = [h, h + n]
+        h += n
+    # Games without a completed hand sit between the hands of the games around them.
+    h = hand_start
+    for game in added:
+        if spans[game][2] is None:
+            spans[game][2:] = [h, h]
+        h = spans[game][3]
+    return spans
+
+
+def _memo_key(v):
+    if isinstance(v, list):
+        return tuple(map(id, v))
+    if hasattr(v, 'hand_index'):
+        # A DocumentFilter, keyed by the rows and hands it selected.
+        return 'filter', tuple(map(id, v.rows)), tuple(map(id, v.hands))
+    return v
+
+
+def _memoize(method):
+    """
+    Caches a Poker method's results per argument set, see Poker.cache_info.
+
+    Parameters
+    ----------
+    method : function.
+        A Poker method taking hashable arguments or lists of rows.
+
+    Returns
+    -------
+    function
+        Returns the wrapped method.
+
+    Notes
+    -----
+    A list or DocumentFilter argument is keyed by the identity of its items, and the entry holds on to the items,
+    so the ids cannot be reused while the entry is cached.
+    The cache is emptied whenever Poker.rows or Poker.hands are replaced or change length.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        memo = self._memo
+        if memo['max_size'] <= 0:
+            return method(self, *args, **kwargs)
+        state = (id(self.rows), len(self.rows), id(self.hands), len(self.hands))
+        if memo['state'] != state:
+            memo['entries'].clear()
+            memo['state'] = state
+        keep = tuple(v if hasattr(v, 'hand_index') else tuple(v)
+                     for v in args + tuple(kwargs.values()) if isinstance(v, list) or hasattr(v, 'hand_index'))
+        key = (method.__name__, tuple(_memo_key(v) for v in args),
+               tuple(sorted((k, _memo_key(v)) for k, v in kwargs.items())))
+        entries = memo['entries']
+        if key in entries:
+            memo['hits'] += 1
+            entries.move_to_end(key)
+            return copy.deepcopy(entries[key][1])
+        memo['misses'] += 1
+        result = method(self, *args, **kwargs)
+        entries[key] = (keep, result)
+        if len(entries) > memo['max_size']:
+            entries.popitem(last=False)
+            memo['evictions'] += 1
+        return copy.deepcopy(result)
+    return wrapper
+
+
 # def _replace_ace(l: list, t) -> list:
 #     ll = list(l)
 #     for i in ('Hearts', 'Spades', 'Diamonds', 'Clubs'):
@@ -6,8 +6,19 @@ Functions used in the parsing of Poker Now logs.
 import os
 import re
 import csv
+import json
+import zlib
+import pickle
+import hashlib
 import datetime
-from poker.classes.hand import Hand
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from poker.classes.hand import Hand, CompactHand
+from poker.classes.events import EventTable
+from poker.classes.resolver import _as_resolver
+
+# Bump whenever parser() output changes so stale cache entries are ignored.
+PARSER_VERSION = 3
 
 
 def group_names(d: dict = None) -> dict:
@@ -46,7 +57,73 @@ def read_csv(folder: str, file_name: str) -> list:
     return rows
 
 
-def get_player_lookup(path: str, grouped: dict = None) -> dict:
+def hash_file(filepath: str, chunk: int = 65536) -> str:
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        while block := f.read(chunk):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _cache_path(cache: str, repo: str, file_name: str, me: str, grouped: dict = None, compact: bool = False) -> str:
+    """Location of the cached parse for a log file.
+
+    The name is the file's content hash and the parser version, followed by a short hash of the
+    inputs that also shape parser() output (file name, user, grouped ids and hand class).
+    """
+    context = (file_name, me, sorted((k, tuple(v)) for k, v in grouped.items()) if grouped else None)
+    context = repr(context + ('compact',) if compact else context)
+    context = hashlib.sha256(context.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache, f"{hash_file(os.path.join(repo, file_name))}_v{PARSER_VERSION}_{context}.pkl.z")
+
+
+def _load_cache(path: str):
+    """Return the cached (rows, hands) tuple, or None when missing or unreadable. Unreadable entries are removed."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            rows, hands = pickle.loads(zlib.decompress(f.read()))
+        if not isinstance(rows, list) or not isinstance(hands, list):
+            raise TypeError(f"'{path}' does not hold a (rows, hands) tuple.")
+        return rows, hands
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def _save_cache(path: str, result: tuple) -> None:
+    """Write a parsed (rows, hands) tuple, replacing any previous entry atomically."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), 1))
+    os.replace(tmp, path)
+
+
+_PLAYER_TOKEN = re.compile(r'"([^"]+?)\s*@\s*([^"]+)"')
+
+
+def _file_player_names(folder: str, file_name: str) -> dict:
+    """Stream one log's entries and return ``{player_id: {name: None}}``, names in first-seen order."""
+    lookup = {}
+    with open(os.path.join(folder, file_name), 'r', encoding='latin1', newline='') as f:
+        reader = csv.reader(f, delimiter=',')
+        header = next(reader, None)
+        if not header or 'entry' not in header:
+            return lookup
+        col = header.index('entry')
+        for row in reader:
+            if len(row) > col:
+                for name, pid in _PLAYER_TOKEN.findall(row[col]):
+                    lookup.setdefault(pid.strip(), {})[name.strip()] = None
+    return lookup
+
+
+def get_player_lookup(path: str, grouped: dict = None, workers: int = None) -> dict:
     """Read poker log CSVs and return a mapping of player IDs to known names.
 
     Parameters
@@ -58,6 +135,9 @@ def get_player_lookup(path: str, grouped: dict = None) -> dict:
         A canonical guide mapping real names to their known IDs, e.g.
         ``{'Peter': ('mQWfGaGPXE', 'hOG9_DzBzN'), ...}``.
         When provided the return shape changes — see below.
+    workers : int, optional
+        When greater than one the files are scanned in a process pool and merged in file order,
+        so the result is identical to the serial scan.
 
     Returns
     -------
@@ -69,6 +149,11 @@ def get_player_lookup(path: str, grouped: dict = None) -> dict:
             ``{canonical_name: {'ids': [...], 'names': [...]}}`` where ``ids``
             are taken from ``grouped`` and ``names`` is the deduplicated union
             of every display name seen in the data for those IDs.
+
+    Notes
+    -----
+    Each file is streamed row by row, only the ``entry`` column is kept and names are deduplicated
+    with insertion-ordered dicts.
     """
     # Decide whether path is a file or directory and build file list
     if os.path.isfile(path):
@@ -77,22 +162,19 @@ def get_player_lookup(path: str, grouped: dict = None) -> dict:
         folder = path
         files = [f for f in os.listdir(path) if f.endswith('.csv')]
 
-    # Pattern captures the "Name @ ID" tokens wrapped in quotes within entries
-    pattern = re.compile(r'"([^"]+?)\s*@\s*([^"]+)"')
+    if workers and workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            chunk = max(1, len(files) // (workers * 4))
+            lookups = list(pool.map(_file_player_names, repeat(folder), files, chunksize=chunk))
+    else:
+        lookups = (_file_player_names(folder, file) for file in files)
 
-    # Build raw id -> [display names] lookup from every CSV row
-    raw_lookup: dict[str, list[str]] = {}
-    for file in files:
-        rows = read_csv(folder, file)
-        for row in rows:
-            entry = row.get('entry', '')
-            for name, pid in pattern.findall(entry):
-                name = name.strip()
-                pid = pid.strip()
-                if pid not in raw_lookup:
-                    raw_lookup[pid] = []
-                if name not in raw_lookup[pid]:
-                    raw_lookup[pid].append(name)
+    # Build raw id -> {display names} lookup, merged in file order
+    raw_names: dict[str, dict] = {}
+    for lookup in lookups:
+        for pid, names in lookup.items():
+            raw_names.setdefault(pid, {}).update(names)
+    raw_lookup = {pid: list(names) for pid, names in raw_names.items()}
 
     if grouped is None:
         return raw_lookup
@@ -103,12 +185,10 @@ def get_player_lookup(path: str, grouped: dict = None) -> dict:
     # Merge with the canonical guide
     merged: dict[str, dict] = {}
     for canonical_name, ids in grouped.items():
-        all_names = []
+        all_names = {}
         for pid in ids:
-            for display_name in raw_lookup.get(pid, []):
-                if display_name not in all_names:
-                    all_names.append(display_name)
-        merged[canonical_name] = {'ids': list(ids), 'names': all_names}
+            all_names.update(raw_names.get(pid, {}))
+        merged[canonical_name] = {'ids': list(ids), 'names': list(all_names)}
 
     # Add any IDs found in the data that aren't covered by the guide
     for pid, names in raw_lookup.items():
@@ -118,11 +198,43 @@ def get_player_lookup(path: str, grouped: dict = None) -> dict:
     return merged
 
 
-def rename_logs(path: str, dry_run: bool = False) -> list:
+_AT_PATTERN = re.compile(rb',(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})')
+
+
+def _log_start_date(folder: str, file_name: str, block: int = 16384):
+    """Return the date of the earliest ``at`` timestamp in a log, None when it has none.
+
+    Poker Now exports are ordered by time, newest first, so only the first and last ``block`` bytes are read.
+    When the timestamps in those blocks are not ordered one way or the other, or ``block`` is None,
+    the whole file is scanned line by line.
+    """
+    with open(os.path.join(folder, file_name), 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        stamps = None
+        if block and size > 2 * block:
+            f.seek(0)
+            head = _AT_PATTERN.findall(f.read(block))
+            f.seek(size - block)
+            tail = _AT_PATTERN.findall(f.read(block))
+            ordered = head + tail
+            if ordered and (ordered == sorted(ordered) or ordered == sorted(ordered, reverse=True)):
+                stamps = ordered
+        if stamps is None:
+            f.seek(0)
+            stamps = [m.group(1) for m in map(_AT_PATTERN.search, f) if m]
+    if not stamps:
+        return None
+    try:
+        return datetime.date.fromisoformat(min(stamps)[:10].decode())
+    except ValueError:
+        return None
+
+
+def rename_logs(path: str, dry_run: bool = False, workers: int = None, probe: bool = True) -> list:
     """Rename Poker Now CSV log files to a standard ``YYYY_MM_DD_Poker Log`` format.
 
     The game date is determined by reading the earliest ``at`` timestamp found
-    inside each CSV.  Files that already match the target naming scheme are
+    inside each CSV, see ``_log_start_date``.  Files that already match the target naming scheme are
     skipped.  When more than one file maps to the same calendar date the first
     file keeps the plain name and each subsequent collision receives a numeric
     suffix (``_02``, ``_03``, …).
@@ -135,6 +247,13 @@ def rename_logs(path: str, dry_run: bool = False) -> list:
         When ``True`` the function prints what would be renamed without
         actually writing anything to disk.  Useful for previewing changes
         before committing.  Defaults to ``False``.
+    workers : int, optional
+        Number of threads probing the files for their date.  Defaults to
+        the ``ThreadPoolExecutor`` default.
+    probe : bool, optional
+        When ``True`` only the head and tail of time-ordered logs are read.
+        ``False`` scans every line, for exports whose rows may be out of
+        order.  Defaults to ``True``.
 
     Returns
     -------
@@ -148,31 +267,10 @@ def rename_logs(path: str, dry_run: bool = False) -> list:
     files = [f for f in os.listdir(path) if f.endswith('.csv')]
 
     # --- pass 1: resolve the game date for every file that needs renaming ---
-    pending = []   # list of (old_name, date_obj)
-    for file in files:
-        if target_pattern.match(file):
-            continue  # already correctly named — skip
-
-        rows = read_csv(path, file)
-        if not rows:
-            continue
-
-        # Find the earliest timestamp in the file to get the true game date
-        dates = []
-        for row in rows:
-            at_raw = row.get('at', '')
-            if at_raw:
-                try:
-                    dt = datetime.datetime.strptime(at_raw.split('.')[0], '%Y-%m-%dT%H:%M:%S')
-                    dates.append(dt.date())
-                except ValueError:
-                    pass
-
-        if not dates:
-            continue
-
-        game_date = min(dates)
-        pending.append((file, game_date))
+    todo = [f for f in files if not target_pattern.match(f)]  # already correctly named files are skipped
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        dates = list(pool.map(_log_start_date, repeat(path), todo, repeat(16384 if probe else None)))
+    pending = [(file, game_date) for file, game_date in zip(todo, dates) if game_date is not None]
 
     # --- pass 2: sort by (date, original name) for deterministic ordering ---
     pending.sort(key=lambda x: (x[1], x[0]))
@@ -212,12 +310,161 @@ def rename_logs(path: str, dry_run: bool = False) -> list:
     return renames
 
 
-def find_duplicates(path: str, dry_run: bool = True, delete: bool = False) -> dict:
+def _partial_hash(filepath: str, block: int = 65536) -> str:
+    """Return the SHA-256 hex digest of a file's first and last blocks, of the whole file when it is two blocks or less."""
+    with open(filepath, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        if size <= 2 * block:
+            return hashlib.sha256(f.read()).hexdigest()
+        h = hashlib.sha256(f.read(block))
+        f.seek(size - block)
+        h.update(f.read(block))
+        return h.hexdigest()
+
+
+def _load_manifest(path: str) -> dict:
+    """Return the hash manifest written by find_duplicates, empty when missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(path: str, manifest: dict) -> None:
+    """Write the hash manifest, replacing any previous one atomically."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=0, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _csv_files(path: str) -> dict:
+    """Return the absolute path of every .csv file under path, mapped to its (size, mtime_ns)."""
+    files = {}
+    for dirpath, _, filenames in os.walk(path):
+        for fname in filenames:
+            if not fname.lower().endswith('.csv'):
+                continue
+            full = os.path.abspath(os.path.join(dirpath, fname))
+            st = os.stat(full)
+            files[full] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def _edge_lines(filepath: str, block: int = 65536) -> tuple:
+    """Return a log's header line with its line terminator, first data line and last data line."""
+    with open(filepath, 'rb') as f:
+        head = f.read(block)
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(size - block, 0))
+        tail = f.read(block)
+    lines = head.split(b'\n', 2)
+    if len(lines) < 3 and not (len(lines) == 2 and lines[1]):
+        return None
+    last = tail.rstrip(b'\r\n').rsplit(b'\n', 1)[-1]
+    return lines[0] + b'\n', lines[1].rstrip(b'\r'), last.rstrip(b'\r')
+
+
+def _same_bytes(path_a: str, offset_a: int, path_b: str, offset_b: int, length: int, chunk: int = 65536) -> bool:
+    """Return True when length bytes of two files, read from the given offsets, are equal."""
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        a.seek(offset_a)
+        b.seek(offset_b)
+        while length > 0:
+            n = min(chunk, length)
+            if a.read(n) != b.read(n):
+                return False
+            length -= n
+    return True
+
+
+def _contains_export(shorter: str, longer: str, edges: dict, files: dict):
+    """Return how longer holds every row of shorter, 'suffix' or 'prefix', else None."""
+    header, size_a, size_b = edges[shorter][0], files[shorter][0], files[longer][0]
+    if header != edges[longer][0] or size_a >= size_b:
+        return None
+    # Newest-first exports: the line break ending the header, then the older export's rows, end the newer file.
+    body = size_a - len(header) + 1
+    if edges[shorter][2] == edges[longer][2] and _same_bytes(shorter, len(header) - 1, longer, size_b - body, body):
+        return 'suffix'
+    # Oldest-first exports: the older export, up to its last line break, starts the newer file.
+    if edges[shorter][1] == edges[longer][1] and _same_bytes(shorter, size_a - 1, longer, size_a - 1, 1) and \
+            _same_bytes(shorter, 0, longer, 0, size_a):
+        with open(shorter, 'rb') as f:
+            f.seek(size_a - 1)
+            if f.read(1) == b'\n':
+                return 'prefix'
+    return None
+
+
+def find_near_duplicates(path: str, workers: int = None, files: dict = None) -> list:
+    """Find CSV exports whose rows are all contained in a longer export of the same game.
+
+    Exporting a game twice at different times gives two logs where the earlier one holds a subset of
+    the later one's rows.  Poker Now writes the newest row first, so the earlier export's rows end the
+    later file (a suffix after the header).  Logs sorted oldest first give a byte prefix instead; both
+    are checked.  Files with identical content are left to :func:`find_duplicates`.
+
+    Parameters
+    ----------
+    path : str
+        Root directory to scan.  All subdirectories are included recursively.
+    workers : int, optional
+        Threads reading the files, by default the ThreadPoolExecutor default.
+    files : dict, optional
+        Absolute path -> (size, mtime_ns) of the files to check, by default every ``.csv`` under ``path``.
+
+    Returns
+    -------
+    list
+        ``(shorter, longer, kind)`` tuples, one per contained file, where ``longer`` is the largest
+        export containing it and ``kind`` is ``'suffix'`` or ``'prefix'``.
+
+    Notes
+    -----
+    Candidates must share the header and either their last (suffix) or first (prefix) data line, only
+    those are compared in full.
+    """
+    files = _csv_files(path) if files is None else files
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        edges = dict(zip(files, pool.map(_edge_lines, files)))
+    edges = {k: v for k, v in edges.items() if v is not None}
+
+    candidates = {}
+    for p, (header, first, last) in edges.items():
+        candidates.setdefault(('suffix', header, last), []).append(p)
+        candidates.setdefault(('prefix', header, first), []).append(p)
+    pairs = {}
+    for group in candidates.values():
+        if len(group) > 1:
+            for p in group:
+                pairs.setdefault(p, set()).update(group)
+
+    found = []
+    for shorter in sorted(pairs):
+        for longer in sorted(pairs[shorter], key=lambda q: (-files[q][0], q)):
+            kind = _contains_export(shorter, longer, edges, files)
+            if kind:
+                found.append((shorter, longer, kind))
+                break
+    return found
+
+
+def find_duplicates(path: str, dry_run: bool = True, delete: bool = False, workers: int = None,
+                    manifest: str = None, near: bool = False, block: int = 65536) -> dict:
     """Find duplicate CSV files by content hash, regardless of filename.
 
-    Walks the entire directory tree rooted at ``path``, hashes every ``.csv``
-    file with SHA-256, and groups files that share the same hash.  Files with
-    a unique hash are never reported.
+    Walks the entire directory tree rooted at ``path`` and groups ``.csv``
+    files that share the same SHA-256 hash.  Files with a unique hash are
+    never reported.
+
+    Hashing is tiered: a file whose size no other file has is unique without
+    being read, files of equal size are compared on a hash of their first and
+    last ``block`` bytes, and only files that still collide are hashed in full.
+    Reads run in a thread pool.
 
     Parameters
     ----------
@@ -233,6 +480,19 @@ def find_duplicates(path: str, dry_run: bool = True, delete: bool = False) -> di
         paths alphabetically — the lexicographically smallest path is kept so
         that root-level files are preferred over those in subdirectories.
         Defaults to ``False``.
+    workers : int, optional
+        Threads hashing files, by default the ThreadPoolExecutor default.
+    manifest : str, optional
+        JSON file of the hashes computed so far, keyed by path and checked
+        against size and mtime_ns.  Read before and rewritten after the scan,
+        so later runs only hash new or changed files.  Defaults to ``None``
+        (no manifest).
+    near : bool, optional
+        When ``True`` also reports exports contained in a longer export of the
+        same game, see :func:`find_near_duplicates`.  These are never deleted.
+        Defaults to ``False``.
+    block : int, optional
+        Bytes read from each end of a file for the partial hash, by default 65536.
 
     Returns
     -------
@@ -246,31 +506,61 @@ def find_duplicates(path: str, dry_run: bool = True, delete: bool = False) -> di
     >>> # Preview duplicates without changing anything
     >>> dupes = find_duplicates(r'poker/.data', dry_run=True)
 
+    >>> # Keep the hashes between runs
+    >>> dupes = find_duplicates(r'poker/.data', manifest=r'poker/.data/hashes.json')
+
     >>> # Delete duplicates (keeps root-level / lexicographically first file)
     >>> dupes = find_duplicates(r'poker/.data', dry_run=False, delete=True)
     """
-    import hashlib
+    files = _csv_files(path)
+    known = _load_manifest(manifest) if manifest else {}
+    partial, digests = {}, {}
+    for p, (size, mtime) in files.items():
+        entry = known.get(p)
+        if isinstance(entry, dict) and entry.get('size') == size and entry.get('mtime_ns') == mtime and \
+                entry.get('block') == block:
+            partial[p] = entry.get('partial')
+            if entry.get('sha256'):
+                digests[p] = entry['sha256']
+
+    # Only files sharing a size can be duplicates, then only those sharing their first and last blocks.
+    by_size = {}
+    for p, (size, _) in files.items():
+        by_size.setdefault(size, []).append(p)
+    same_size = [p for paths in by_size.values() if len(paths) > 1 for p in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        todo = [p for p in same_size if not partial.get(p)]
+        partial.update(zip(todo, pool.map(_partial_hash, todo, repeat(block))))
+        by_partial = {}
+        for p in same_size:
+            if files[p][0] <= 2 * block:
+                digests[p] = partial[p]
+            by_partial.setdefault((files[p][0], partial[p]), []).append(p)
+        collisions = [paths for paths in by_partial.values() if len(paths) > 1]
+        todo = [p for paths in collisions for p in paths if p not in digests]
+        digests.update(zip(todo, pool.map(hash_file, todo)))
 
-    def _hash_file(filepath: str, chunk: int = 65536) -> str:
-        h = hashlib.sha256()
-        with open(filepath, 'rb') as f:
-            while block := f.read(chunk):
-                h.update(block)
-        return h.hexdigest()
-
-    # Walk the full directory tree and hash every CSV
     hash_map: dict[str, list[str]] = {}
-    for dirpath, _, filenames in os.walk(path):
-        for fname in filenames:
-            if not fname.lower().endswith('.csv'):
-                continue
-            full = os.path.abspath(os.path.join(dirpath, fname))
-            digest = _hash_file(full)
-            hash_map.setdefault(digest, []).append(full)
+    for paths in collisions:
+        for p in paths:
+            hash_map.setdefault(digests[p], []).append(p)
+
+    if manifest:
+        _save_manifest(manifest, {p: {'size': files[p][0], 'mtime_ns': files[p][1], 'block': block,
+                                      'partial': partial[p], 'sha256': digests.get(p)} for p in partial})
 
     # Keep only groups with more than one file
     duplicates = {h: sorted(paths) for h, paths in hash_map.items() if len(paths) > 1}
 
+    if near:
+        contained = find_near_duplicates(path, workers=workers, files=files)
+        if contained:
+            print(f'Found {len(contained)} export(s) contained in a longer export of the same game:\n')
+            for shorter, longer, kind in contained:
+                print(f'    PART : {shorter}')
+                print(f'    OF   : {longer}  [{kind}]')
+            print()
+
     if not duplicates:
         print('No duplicate files found.')
         return duplicates
@@ -300,21 +590,53 @@ def find_duplicates(path: str, dry_run: bool = True, delete: bool = False) -> di
     return duplicates
 
 
-def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
+# Suit glyphs as they come out of a latin1 read of the utf-8 logs, with an optional leading 1 for aces.
+_SUITS = re.compile('(1?)â\u0099([£¦¥]?)')
+_SUIT_NAMES = {'£': ' Clubs', '¦': ' Diamonds', '¥': ' Hearts', '': ' Spades'}
+
+# Every frequent line shape in one pattern, so a single match classifies the line and extracts its fields:
+# player actions '"Name @ ID" <verb> ..', board cards 'Flop:  [..]', 'Turn: .. [..]', .. and 'Your hand is ..'.
+_LINE = re.compile(r'"([^"]*)" (?:(calls|bets|raises to|posts a (?:missed |missing )?(?:big|small) blind of)'
+                   r' ([^ ]*)(?: and go all in)?|(checks|folds)|shows a (.*)|collected ([^ ]*) from .*)$'
+                   r'|([Ff]lop|[Tt]urn|[Rr]iver|[Uu]ndealt cards)[^\[]*\[([^\[]*)'
+                   r'|Your hand is (.*)')
+_CARDS = re.compile(r'\s*,\s*')
+_MOVES = {'calls': 'Call', 'bets': 'Bet', 'raises to': 'Raise', 'posts a big blind of': 'Big Blind',
+          'posts a missed big blind of': 'Big Blind', 'posts a missing big blind of': 'Big Blind',
+          'posts a small blind of': 'Small Blind', 'posts a missed small blind of': 'Small Blind',
+          'posts a missing small blind of': 'Small Blind', 'checks': 'Checks', 'folds': 'Fold',
+          'flop': 'Flop', 'turn': 'Turn', 'river': 'River', 'undealt cards': 'Undealt Cards'}
+_BOARD = {'Flop': ('flop', 'Post Flop'), 'Turn': ('turn', 'Post Turn'), 'River': ('river', 'Post River'),
+          'Undealt Cards': ('undealt', None)}
+
+
+def _suit_name(m) -> str:
+    return ('A' if m.group(1) else '') + _SUIT_NAMES[m.group(2)]
+
 
-    lst, keep, player_names, hand_cnt, start_end, chips, player_dct, raw = [], False, set(), 1, {}, {}, group_names(player_dct), read_csv(repo, file_name)[::-1]
-    for i in raw:
+def _parse_at(at: str) -> datetime.datetime:
+    """Log timestamp, e.g. 2021-01-01T22:41:49.215Z, to a naive UTC datetime keeping the milliseconds."""
+    try:
+        return datetime.datetime.fromisoformat(at[:-1] if at.endswith('Z') else at)
+    except ValueError:
+        return datetime.datetime.strptime(at.split('.')[0].replace('T', ' '), '%Y-%m-%d %H:%M:%S')
+
+
+def _read_events(repo: str, file_name: str):
+    """Yield the rows of a log in the order they were played.
+
+    Each row gets its hand number, the hand's start/end times and the player stacks at the start of the hand.
+    Rows are held back one hand at a time, until the next hand starts, so the hand's end time is known.
+    """
+    keep, player_names, hand_cnt, start_end, chips, block, raw = False, set(), 1, {}, {}, [], read_csv(repo, file_name)
+    while raw:
+        # Logs are saved newest first, popping from the end walks them forward and frees each row as it goes.
+        i = raw.pop()
         i['game_id'] = file_name
-        i['at'] = datetime.datetime.strptime(i['at'].split('.')[0].replace('T', ' '), '%Y-%m-%d %H:%M:%S')
-        i['entry'] = i['entry'].strip()\
-            .replace("â£", " Clubs")\
-            .replace("â¦", " Diamonds")\
-            .replace("â¥", " Hearts")\
-            .replace("â", " Spades")\
-            .replace('1 Clubs', 'A Clubs')\
-            .replace('1 Diamonds', 'A Diamonds')\
-            .replace('1 Hearts', 'A Hearts')\
-            .replace('1 Spades', 'A Spades')
+        i['at'] = _parse_at(i['at'])
+        i['entry'] = i['entry'].strip()
+        if 'â' in i['entry']:
+            i['entry'] = _SUITS.sub(_suit_name, i['entry'])
         if i.get('oder'):
             del i['order']
 
@@ -326,6 +648,10 @@ def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
                 continue
         else:
             if i['entry'].startswith('-- starting hand #'):
+                for j in block:
+                    j['hand'] = {**j['hand'], **start_end[j['hand']['number']]}
+                    yield j
+                block = []
                 hand_cnt = int(i['entry'].replace('-- starting hand #', '').split('(')[0].strip())
                 start_end[hand_cnt] = {'startTs': i['at'], 'endTs': None}
                 chips = {}
@@ -344,28 +670,41 @@ def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
             if not i['entry'].startswith('-- starting hand #')\
                     and not i['entry'].startswith('-- ending hand #')\
                     and i['entry'] not in ('Dead Small Blind', 'Dead Big Blind'):
-                lst.append(i)
-
-    # Hand Related
-    hand_dct, hand_lst = {'win_cards': [], 'event_lst': [], 'event_dct': {}}, []
-
-    # Event Related
-    prev_dct = {'hand_cnt': 1,
-                'pot': 0.0,
-                'starting_chips': {},
-                'current_chips': {},
-                'time': lst[0]['at'],
-                'player': None,
-                'amount': None,
-                'position': 'Pre Flop',
-                'event': None,
-                'winner': {'players': []},
-                'table_cards': {'winner': []},
-                'joined': [],
-                'remaining_players': []}
-
-    for i in lst:
-        i['hand'] = {**i['hand'], **start_end[i['hand']['number']]}
+                block.append(i)
+    for j in block:
+        j['hand'] = {**j['hand'], **start_end[j['hand']['number']]}
+        yield j
+
+
+def _hand_state(hand_cnt: int, starting_chips: dict, time: datetime.datetime) -> dict:
+    """Running state of the hand being parsed."""
+    return {'hand_cnt': hand_cnt,
+            'pot': 0.0,
+            'starting_chips': dict(starting_chips),
+            'current_chips': dict(starting_chips),
+            'time': time,
+            'player': None,
+            'amount': None,
+            'position': 'Pre Flop',
+            'event': None,
+            'winner': {'players': []},
+            'table_cards': {'winner': []},
+            'joined': [],
+            'remaining_players': []}
+
+
+def _parse_events(repo: str, file_name: str, me: str, player_dct: dict = None, rows: list = None):
+    """Yield ``(row, hand)`` for each parsed row, where hand is the Hand completed by that row, otherwise None.
+
+    A hand is completed when the first row of the next hand arrives, so the last hand of a log is never yielded.
+    When the caller appends every yielded row to ``rows``, pass that list to get CompactHands that point into it.
+    ``player_dct`` is grouped, or an IdentityResolver to share one across files.
+    """
+    resolver, hand_dct, prev_dct = _as_resolver(player_dct), {'win_cards': [], 'event_lst': [], 'event_dct': {}}, None
+    for i in _read_events(repo, file_name):
+        hand = None
+        if prev_dct is None:
+            prev_dct = _hand_state(1, {}, i['at'])
         if i.get('hand') and i['hand']['number'] != prev_dct['hand_cnt']:
             # Save old information
             hand_dct['game_id'] = prev_dct['event']['game_id']
@@ -377,7 +716,7 @@ def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
             hand_dct['ending_chips'] = dict(prev_dct['current_chips'])
             hand_dct['total_chips'] = sum(list(hand_dct['ending_chips'].values()))
             hand_dct['position'] = prev_dct['position']
-            hand_dct['all_cards'] = list(set(sum(list(prev_dct['table_cards'].values()), [])))
+            hand_dct['all_cards'] = list(dict.fromkeys(sum(list(prev_dct['table_cards'].values()), [])))
             hand_dct['table_cards'] = prev_dct['table_cards']
             hand_dct['pot_size'] = prev_dct['pot']
             hand_dct['joined'] = prev_dct['joined']
@@ -389,127 +728,80 @@ def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
             for j in prev_dct['winner']['players']:
                 if j in prev_dct['table_cards']:
                     hand_dct['win_cards'].extend(prev_dct['table_cards'][j])
-            hand_dct['win_cards'] = list(set(hand_dct['win_cards']))
-            hand_lst.append(Hand(hand_dct))
+            hand_dct['win_cards'] = list(dict.fromkeys(hand_dct['win_cards']))
+            hand = Hand(hand_dct) if rows is None else CompactHand(hand_dct, rows)
             hand_dct = {'win_cards': [], 'event_lst': [], 'event_dct': {}}
 
             # Reset prev_dct
-            prev_dct = {'hand_cnt': i['hand']['number'],
-                        'pot': 0.0,
-                        'starting_chips': dict(i['starting_chips']),
-                        'current_chips': dict(i['starting_chips']),
-                        'time': i['at'],
-                        'player': None,
-                        'amount': None,
-                        'position': 'Pre Flop',
-                        'event': None,
-                        'winner': {'players': []},
-                        'table_cards': {'winner': []},
-                        'joined': [],
-                        'remaining_players': []}
-
-        if i['entry'].endswith(' and go all in'):
+            prev_dct = _hand_state(i['hand']['number'], i['starting_chips'], i['at'])
+
+        entry, player = i['entry'], None
+        if entry.endswith(' and go all in'):
             i['allIn'] = True
 
-        if ' calls ' in i['entry']:
-            i['move'], i['value'] = 'Call', i['entry'].split(' calls ')[1]
-            if i.get('allIn', False):
-                i['value'] = i['value'].replace(' and go all in', '')
-            i['value'] = float(i['value'])
-        elif i['entry'].endswith('checks'):
-            i['move'] = 'Checks'
-        elif i['entry'].endswith('folds'):
-            i['move'] = 'Fold'
-        elif ' bets ' in i['entry']:
-            i['move'], i['value'] = 'Bet', i['entry'].split(' bets ')[1]
-            if i.get('allIn', False):
-                i['value'] = i['value'].replace(' and go all in', '')
-            i['value'] = float(i['value'])
-        elif ' shows ' in i['entry']:
-            i['move'], i['cards'] = 'Show', i['entry'].split(' shows a ')[1].replace('.', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['player'], prev_dct['amount'], prev_dct['table_cards'][i['entry'].split('"')[1]] = None, None, i['cards']
-        elif ' collected ' in i['entry']:
-            i['move'], i['value'] = 'Win', float(i['entry'].split(' collected ')[1].split(' from ')[0])
-            if i['entry'].endswith(')'):
-                i['winWith'] = i['entry'].split(' pot with ')[1].replace(' (combination: ', ', [').replace(')', ']')
-                i['cards'] = i['winWith'].split('[')[1].replace(']', '').split(',')
-                i['cards'] = [j.strip() for j in i['cards']]
-                prev_dct['winner']['with'] = i['winWith'].split(', [')[0]
-                prev_dct['table_cards']['winner'] = i['cards']
-            prev_dct['winner']['players'].append(i['entry'].split('"')[1])
-            prev_dct['winner']['value'] = i['value']
-        elif i['entry'].startswith('Player stacks: '):
+        line = _LINE.match(entry)
+        if line:
+            player, verb, value, check_fold, shown, won, street, board, hole = line.groups()
+            if verb:
+                i['move'], i['value'] = _MOVES[verb], float(value)
+            elif check_fold:
+                i['move'] = _MOVES[check_fold]
+            elif shown is not None:
+                i['move'], i['cards'] = 'Show', _CARDS.split(shown.replace('.', '').strip())
+                prev_dct['player'], prev_dct['amount'], prev_dct['table_cards'][player] = None, None, i['cards']
+            elif won is not None:
+                i['move'], i['value'] = 'Win', float(won)
+                if entry.endswith(')'):
+                    i['winWith'] = entry.split(' pot with ')[1].replace(' (combination: ', ', [').replace(')', ']')
+                    i['cards'] = [j.strip() for j in i['winWith'].split('[')[1].replace(']', '').split(',')]
+                    prev_dct['winner']['with'] = i['winWith'].split(', [')[0]
+                    prev_dct['table_cards']['winner'] = i['cards']
+                prev_dct['winner']['players'].append(player)
+                prev_dct['winner']['value'] = i['value']
+            elif street:
+                i['move'], i['cards'] = _MOVES[street.lower()], _CARDS.split(board.replace(']', '').strip())
+                key, position = _BOARD[i['move']]
+                prev_dct['player'], prev_dct['amount'], prev_dct['table_cards'][key] = None, None, i['cards']
+                if position:
+                    prev_dct['position'] = position
+            else:
+                i['player'], i['move'], i['cards'] = me, 'Your Hand', _CARDS.split(hole.strip())
+                prev_dct['table_cards']['your_cards'] = i['cards']
+        elif entry.startswith('Player stacks: '):
             prev_dct['starting_chips'] = dict(i['starting_chips'])
             prev_dct['remaining_players'] = list(prev_dct['starting_chips'].keys())
-        elif ' big blind of ' in i['entry']:
-            i['move'], i['value'] = 'Big Blind', i['entry'].split(' big blind of ')[1]
-            if i.get('allIn', False):
-                i['value'] = i['value'].replace(' and go all in', '')
-            i['value'] = float(i['value'])
-        elif ' raises to ' in i['entry']:
-            i['move'], i['value'] = 'Raise', i['entry'].split(' raises to ')[1]
-            if i.get('allIn', False):
-                i['value'] = i['value'].replace(' and go all in', '')
-            i['value'] = float(i['value'])
-        elif ' small blind of ' in i['entry']:
-            i['move'], i['value'] = 'Small Blind', i['entry'].split(' small blind of ')[1]
-            if i.get('allIn', False):
-                i['value'] = i['value'].replace(' and go all in', '')
-            i['value'] = float(i['value'])
-        elif i['entry'].startswith('Your hand is'):
-            i['player'], i['move'], i['cards'] = me, 'Your Hand', i['entry'].replace('Your hand is ', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['table_cards']['your_cards'] = i['cards']
-        elif i['entry'].startswith('Flop') or i['entry'].startswith('flop'):
-            i['move'], i['cards'] = 'Flop', i['entry'].split('[')[1].replace(']', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['player'], prev_dct['amount'], prev_dct['position'], prev_dct['table_cards']['flop'] = None, None, 'Post Flop', i['cards']
-        elif i['entry'].startswith('Turn') or i['entry'].startswith('turn'):
-            i['move'], i['cards'] = 'Turn', i['entry'].split('[')[1].replace(']', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['player'], prev_dct['amount'], prev_dct['position'], prev_dct['table_cards']['turn'] = None, None, 'Post Turn', i['cards']
-        elif i['entry'].startswith('River') or i['entry'].startswith('river'):
-            i['move'], i['cards'] = 'River', i['entry'].split('[')[1].replace(']', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['player'], prev_dct['amount'], prev_dct['position'], prev_dct['table_cards']['river'] = None, None, 'Post River', i['cards']
-        elif i['entry'].startswith('Undealt cards') or i['entry'].startswith('undealt cards'):
-            i['move'], i['cards'] = 'Undealt Cards', i['entry'].split('[')[1].replace(']', '').split(',')
-            i['cards'] = [j.strip() for j in i['cards']]
-            prev_dct['player'], prev_dct['amount'], prev_dct['table_cards']['undealt'] = None, None, i['cards']
-        elif i['entry'].startswith('Uncalled bet '):
-            i['move'], i['value'] = 'Uncalled Bet', float(i['entry'].replace('Uncalled bet of ', '').split(' returned to')[0])
+        elif entry.startswith('Uncalled bet '):
+            i['move'], i['value'] = 'Uncalled Bet', float(entry.replace('Uncalled bet of ', '').split(' returned to')[0])
             prev_dct['player'], prev_dct['amount'] = None, None
-        elif ' joined the game with ' in i['entry']:
+        elif ' joined the game with ' in entry:
             i['move'] = 'Joined'
-            prev_dct['joined'].append(i['entry'].split('"')[1])
-            i['value'] = float(i['entry'].split('with a stack of ')[1].replace('.', ''))
-        elif i['entry'].endswith('requested a seat.'):
+            prev_dct['joined'].append(entry.split('"')[1])
+            i['value'] = float(entry.split('with a stack of ')[1].replace('.', ''))
+        elif entry.endswith('requested a seat.'):
             i['move'] = 'Request'
-        elif i['entry'].startswith('The admin approved the '):
+        elif entry.startswith('The admin approved the '):
             i['move'] = 'Approved'
-            i['value'] = float(i['entry'].split('with a stack of ')[1].replace('.', ''))
-        elif 'stand up with ' in i['entry']:
+            i['value'] = float(entry.split('with a stack of ')[1].replace('.', ''))
+        elif 'stand up with ' in entry:
             i['move'] = 'Stands'
-            i['value'] = float(i['entry'].split('with the stack of ')[1].replace('.', ''))
-        elif ' sit back with ' in i['entry']:
+            i['value'] = float(entry.split('with the stack of ')[1].replace('.', ''))
+        elif ' sit back with ' in entry:
             i['move'] = 'Sits'
-            i['value'] = float(i['entry'].split('with the stack of ')[1].replace('.', ''))
-        elif ' quits the game with ' in i['entry']:
+            i['value'] = float(entry.split('with the stack of ')[1].replace('.', ''))
+        elif ' quits the game with ' in entry:
             i['move'] = 'Quits'
-            i['value'] = float(i['entry'].split('with a stack of ')[1].replace('.', ''))
-        elif i['entry'].startswith('The game')\
-                or 'run it twice' in i['entry']\
-                or i['entry'].startswith('WARNING:')\
-                or i['entry'].startswith('The admin ')\
-                or i['entry'].startswith('Remaining players ')\
-                or i['entry'].endswith('canceled the seat request.')\
-                or ' passed the room ownership ' in i['entry']:
+            i['value'] = float(entry.split('with a stack of ')[1].replace('.', ''))
+        elif entry.startswith(('The game', 'WARNING:', 'The admin ', 'Remaining players '))\
+                or 'run it twice' in entry\
+                or entry.endswith('canceled the seat request.')\
+                or ' passed the room ownership ' in entry:
             i['move'] = 'Game'
 
         if i.get('move') and i['move'] not in ('Player Stacks', 'Your Hand', 'Flop', 'Turn', 'River', 'Game', 'Undealt Cards'):
-            i['player'], i['playerId'], i['playerName'] = player_id_name(i['entry'])
-            i['playerGroup'] = player_dct.get(i['playerId'], 'other')
+            if player is None:
+                player = entry.split('"')[1]
+            i['player'], i['playerId'] = resolver.player(player), resolver.player_id(player)
+            i['playerName'], i['playerGroup'] = resolver.player_name(player), resolver.group(player, 'other')
 
             if i['move'] in ('Bet', 'Raise', 'Small Blind', 'Big Blind'):
                 if i['move'] in ('Raise', 'Big Blind'):
@@ -545,19 +837,121 @@ def parser(repo: str, file_name: str, me: str, player_dct: dict = None):
             else:
                 hand_dct['event_dct'][i['move']].append(i)
             prev_dct['event'] = i
+        yield i, hand
+
+
+def parser(repo: str, file_name: str, me: str, player_dct: dict = None, compact: bool = False):
+    lst, hand_lst = [], []
+    for i, hand in _parse_events(repo, file_name, me, player_dct, lst if compact else None):
+        if hand is not None:
+            hand_lst.append(hand)
+        lst.append(i)
     return lst, hand_lst
 
 
-def parse_games(repo: str, user_name: str, grouped: dict = None):
-    """This function grabs files within a given repo and parses the log file."""
+def table_parser(repo: str, file_name: str, me: str, player_dct: dict = None) -> EventTable:
+    """Parse a log straight into an EventTable, without keeping the row dicts or Hand objects."""
+    table = EventTable()
+    for i, hand in _parse_events(repo, file_name, me, player_dct):
+        if hand is not None:
+            table.add_hand(hand)
+        table.add_row(i)
+    return table
+
+
+def iter_parser(repo: str, file_name: str, me: str, player_dct: dict = None, rows: bool = False):
+    """Yield the Hand objects of a log one at a time, as each one is completed.
+
+    With ``rows=True`` yields ``(hand, rows)`` tuples, where rows are the parsed rows of that hand.
+    Only the current hand is held in memory, besides the raw rows of the file not yet reached.
+    """
+    lst = []
+    for i, hand in _parse_events(repo, file_name, me, player_dct):
+        if hand is not None:
+            yield (hand, lst) if rows else hand
+            lst = []
+        if rows:
+            lst.append(i)
+
+
+def log_files(repo: str) -> dict:
+    """Return ``{file_name: (size, mtime_ns)}`` for every CSV log file directly inside repo."""
+    stats = {}
+    with os.scandir(repo) as entries:
+        for entry in entries:
+            if entry.name.endswith('.csv') and entry.is_file():
+                stat = entry.stat()
+                stats[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def iter_games(repo: str, user_name: str, grouped: dict = None, rows: bool = False, files: list = None):
+    """Yield Hand objects from every log file in a repo, file by file. See iter_parser."""
     if not os.path.exists(repo):
         raise FileNotFoundError(f"The directory '{repo}' does not exist.")
-    
-    lst, hands = [], []
-    files = [f for f in os.listdir(repo) if os.path.isfile(os.path.join(repo, f))]
+    if files is None:
+        files = [f for f in os.listdir(repo) if os.path.isfile(os.path.join(repo, f)) and f.endswith('.csv')]
     for file in files:
-        if file.endswith('.csv'):
-            event_lst, hand_lst = parser(repo, file, user_name, grouped)
-            lst.extend(event_lst)
-            hands.extend(hand_lst)
+        yield from iter_parser(repo, file, user_name, grouped, rows)
+
+
+def parse_games(repo: str, user_name: str, grouped: dict = None, workers: int = None, cache: str = None,
+                files: list = None, compact: bool = False):
+    """This function grabs files within a given repo and parses the log file.
+
+    Pass ``files`` to parse only those file names instead of every CSV in the repo.
+
+    When ``workers`` is greater than one the files are parsed in a process pool, one file per task.
+    Results are merged in file order so the output is identical to the serial path.
+    When ``cache`` is a directory, each file's parsed rows and hands are stored there keyed by content hash
+    and parser version, and only new or modified files are parsed again.
+    With ``compact`` the hands are CompactHands, which share the parsed rows instead of copying them.
+    """
+    if not os.path.exists(repo):
+        raise FileNotFoundError(f"The directory '{repo}' does not exist.")
+
+    if files is None:
+        files = [f for f in os.listdir(repo) if os.path.isfile(os.path.join(repo, f)) and f.endswith('.csv')]
+    results, paths = [None] * len(files), {}
+    if cache:
+        os.makedirs(cache, exist_ok=True)
+        for ind, file in enumerate(files):
+            paths[ind] = _cache_path(cache, repo, file, user_name, grouped, compact)
+            results[ind] = _load_cache(paths[ind])
+
+    todo = [ind for ind, result in enumerate(results) if result is None]
+    if workers and workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            chunk = max(1, len(todo) // (workers * 4))
+            parsed = list(pool.map(parser, repeat(repo), [files[ind] for ind in todo], repeat(user_name), repeat(grouped),
+                                   repeat(compact), chunksize=chunk))
+    else:
+        parsed = (parser(repo, files[ind], user_name, grouped, compact) for ind in todo)
+    for ind, result in zip(todo, parsed):
+        results[ind] = result
+        if cache:
+            _save_cache(paths[ind], result)
+
+    lst, hands = [], []
+    for event_lst, hand_lst in results:
+        lst.extend(event_lst)
+        hands.extend(hand_lst)
     return lst, hands
+
+
+def parse_table(repo: str, user_name: str, grouped: dict = None, workers: int = None, files: list = None) -> EventTable:
+    """Parse every log file in a repo into a single columnar EventTable. See parse_games."""
+    if not os.path.exists(repo):
+        raise FileNotFoundError(f"The directory '{repo}' does not exist.")
+    if files is None:
+        files = [f for f in os.listdir(repo) if os.path.isfile(os.path.join(repo, f)) and f.endswith('.csv')]
+    if workers and workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            chunk = max(1, len(files) // (workers * 4))
+            tables = list(pool.map(table_parser, repeat(repo), files, repeat(user_name), repeat(grouped), chunksize=chunk))
+    else:
+        tables = (table_parser(repo, file, user_name, grouped) for file in files)
+    table = EventTable()
+    for t in tables:
+        table.extend(t)
+    return table
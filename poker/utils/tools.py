@@ -2,6 +2,8 @@
 """
 from typing import Union, List, Optional
 from collections.abc import KeysView, ValuesView
+from itertools import combinations
+from math import comb, factorial
 import numpy as np
 import pandas as pd
 
@@ -57,6 +59,23 @@ def _to_type(data: Union[list, np.float64, np.float32, np.float16,
         raise AttributeError('new_type can be "int" or "float.')
 
 
+def _to_array(data: Union[list, np.ndarray, pd.Series, int, float, tuple], dtype=float) -> np.ndarray:
+    """Converts list adjacent objects to a 1d array without nan/None values"""
+    if isinstance(data, pd.Series):
+        data = data.to_numpy()
+    elif isinstance(data, (KeysView, ValuesView, tuple)):
+        data = list(data)
+    elif not isinstance(data, (list, np.ndarray, int, float)):
+        raise AttributeError('data needs to have a type of {np.ndarray, pd.Series, list}')
+    arr = np.atleast_1d(np.asarray(data) if dtype is not float else np.asarray(data, dtype=float))
+    if arr.dtype.kind not in 'iu':
+        arr = arr.astype(float, copy=False)
+        nan = np.isnan(arr)
+        if nan.any():
+            arr = arr[~nan]
+    return arr
+
+
 def native_median(data: Union[list, np.ndarray, pd.Series]) -> float:
     """
 
@@ -67,17 +86,15 @@ def native_median(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the Median.
     :rtype: float
     :example: *None*
-    :note: If multiple values have the same count, will return the mean.
-        Median is used if there is an odd number of same count values.
+    :note: np.nan and None values are dropped, the mean of the two middle values is returned for an even count.
+        Returns 0.0 when no values are left.
 
     """
-    data = _to_type(data=_remove_nan(data=_to_list(data=data)), new_type='float')
-    sorted_lst, lst_len = sorted(data), len(data)
-    index = (lst_len - 1) // 2
-    if lst_len % 2:
-        return sorted_lst[index]
-    else:
-        return native_mean(data=[sorted_lst[index]] + [sorted_lst[index + 1]])
+    data = np.sort(_to_array(data=data))
+    n = len(data)
+    if not n:
+        return 0.0
+    return float(data[n // 2]) if n % 2 else float(data[n // 2 - 1] + data[n // 2]) / 2
 
 
 def native_mean(data: Union[list, np.ndarray, pd.Series]) -> float:
@@ -90,14 +107,11 @@ def native_mean(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the mean.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: np.nan and None values are dropped, returns 0.0 when no values are left.
 
     """
-    data = _remove_nan(data=_to_list(data=data))
-    if len(data) != 0:
-        return sum(data) / len(data)
-    else:
-        return 0.0
+    data = _to_array(data=data)
+    return float(data.sum()) / len(data) if len(data) else 0.0
 
 
 def native_variance(data: Union[list, np.ndarray, pd.Series], ddof: int = 1) -> float:
@@ -112,12 +126,14 @@ def native_variance(data: Union[list, np.ndarray, pd.Series], ddof: int = 1) ->
     :return: Returns the Variance.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: np.nan and None values are dropped, returns 0.0 when no more than ddof values are left.
 
     """
-    data = _remove_nan(data=_to_list(data=data))
-    mu = native_mean(data=data)
-    return sum((x - mu) ** 2 for x in data) / (len(data) - ddof)
+    data = _to_array(data=data)
+    if len(data) <= ddof:
+        return 0.0
+    d = data - data.sum() / len(data)
+    return float(d @ d) / (len(data) - ddof)
 
 
 def native_std(data: Union[list, np.ndarray, pd.Series], ddof: Optional[int] = 1) -> float:
@@ -132,10 +148,10 @@ def native_std(data: Union[list, np.ndarray, pd.Series], ddof: Optional[int] = 1
     :return: Returns the Standard Deviation.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: See native_variance.
 
     """
-    return native_variance(data=_to_list(data=data), ddof=ddof) ** .5
+    return native_variance(data=data, ddof=ddof) ** .5
 
 
 def native_sum(data: Union[list, np.ndarray, pd.Series]) -> float:
@@ -148,16 +164,10 @@ def native_sum(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the Sum.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: np.nan and None values are dropped, a float is returned for any length, 0.0 when empty.
 
     """
-    data = _to_type(data=_remove_nan(data=_to_list(data=data)), new_type='float')
-    if len(data) > 1:
-        return sum(data)
-    elif len(data) == 0:
-        return 0.0
-    else:
-        return data
+    return float(_to_array(data=data).sum())
 
 
 def calc_gini(data: Union[list, np.ndarray, pd.Series, tuple]) -> float:
@@ -173,10 +183,11 @@ def calc_gini(data: Union[list, np.ndarray, pd.Series, tuple]) -> float:
         >>> lst = [4.3, 5.6]
         >>> calc_gini(data=lst, val=4, remainder=True) # 0.05445544554455435
     :note: The larger the gini coef, the more consolidated the chips on the table are to one person.
+        Called twice per Hand on a handful of stacks, so it stays in plain Python.
 
     """
     data = _to_list(data=data)
-    if native_sum(data=data) == 0:
+    if sum(data) == 0:
         return 0.0
     l = sorted(data)
     h, a = 0, 0
@@ -197,21 +208,12 @@ def native_max(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the max value.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: np.nan and None values are dropped, returns the largest value even when all are negative.
+        Returns 0.0 when no values are left.
 
     """
-    data = _to_type(data=_remove_nan(data=_to_list(data=data)), new_type='float')
-
-    if len(data) > 1:
-        largest = 0
-        for i in data:
-            if i > largest:
-                largest = i
-        return largest
-    elif len(data) == 0:
-        return 0.0
-    else:
-        return data
+    data = _to_array(data=data)
+    return float(data.max()) if len(data) else 0.0
 
 
 def unique_values(data: Union[list, np.ndarray, pd.Series],
@@ -322,15 +324,20 @@ def native_skew(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the skew value.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: Sample skewness adjusted for bias, as pd.Series.skew. np.nan and None values are dropped.
+        Returns 0.0 for fewer than 3 values or no spread.
 
     """
-    data = _remove_nan(data=_to_list(data=data), replace_val=0.0)
+    data = _to_array(data=data)
     n = len(data)
-    mu = native_mean(data=data)
-    stdn = native_std(data=data, ddof=1)**3
-    nn = ((n * (n-1))**.5) / (n - 2)
-    return (((native_sum(data=[i - mu for i in data])**3) / n) / stdn) * nn
+    if n < 3:
+        return 0.0
+    d = data - data.sum() / n
+    d2 = d * d
+    m2, m3 = d2.sum() / n, d2 @ d / n
+    if m2 == 0:
+        return 0.0
+    return float(m3 / m2 ** 1.5 * (n * (n - 1)) ** .5 / (n - 2))
 
 
 def native_kurtosis(data: Union[list, np.ndarray, pd.Series]) -> float:
@@ -343,14 +350,20 @@ def native_kurtosis(data: Union[list, np.ndarray, pd.Series]) -> float:
     :return: Returns the kurtosis value.
     :rtype: float
     :example: *None*
-    :note: *None*
+    :note: Excess kurtosis, the fourth central moment over the squared variance minus 3, as
+        scipy.stats.kurtosis. np.nan and None values are dropped. Returns 0.0 for no values or no spread.
 
     """
-    data = _remove_nan(data=_to_list(data=data), replace_val=0.0)
+    data = _to_array(data=data)
     n = len(data)
-    mu = native_mean(data=data)
-    stdn = native_std(data=data, ddof=1)**4
-    return (((native_sum(data=[i - mu for i in data])**4) / n) / stdn) - 3
+    if not n:
+        return 0.0
+    d = data - data.sum() / n
+    d2 = d * d
+    m2, m4 = d2.sum() / n, d2 @ d2 / n
+    if m2 == 0:
+        return 0.0
+    return float(m4 / m2 ** 2 - 3)
 
 
 def native_percentile(data: Union[list, np.ndarray, pd.Series], q: float) -> Union[int, float]:
@@ -365,26 +378,18 @@ def native_percentile(data: Union[list, np.ndarray, pd.Series], q: float) -> Uni
     :return: Returns the percentile value.
     :rtype: float
     :example: *None*
-    :note: If input values are floats, will return float values.
+    :note: Returns the value at rank round(len * q) of the sorted values, the largest value for q = 1.
+        Integer inputs return an int, float inputs return a float rounded to 3 decimals. Returns 0 when empty.
 
     """
-    data = _remove_nan(data=_to_list(data=data))
+    data = _to_array(data=data, dtype=None)
     if len(data) == 0:
         return 0
-    data_type = False
-    if isinstance(data[0], float):
-        data_type = True
-        data = [item * 1000 for item in data]
-    data = round_to(data=data, val=1)
-    ind = int(round_to(data=len(data) * q, val=1))
-    data.sort()
-    for item in data:
-        if item >= data[ind]:
-            break
-    if data_type:
-        return item / 1000
-    else:
-        return item
+    ind = min(int(round(len(data) * q)), len(data) - 1)
+    item = np.partition(data, ind)[ind]
+    if data.dtype.kind == 'f':
+        return round(float(item), 3)
+    return int(item)
 
 
 def percent(v1: Union[float, int], v2: Union[float, int]) -> float:
@@ -394,133 +399,476 @@ def percent(v1: Union[float, int], v2: Union[float, int]) -> float:
         return None
 
 
+
+class RunningStats:
+    """
+
+    Running count, mean, variance, min and max, fed one value at a time.
+
+    :param values: Values to start with, default is None. *Optional*
+    :type values: list, np.ndarray, or pd.Series
+    :example:
+        >>> from poker.utils.functions import iter_games
+        >>> stats = RunningStats()
+        >>> for hand in iter_games(repo, user_name, grouped):
+        ...     stats.update(hand.pot_size)
+        >>> stats.mean, stats.std()
+    :note: Welford's update, shards fed in different workers are combined with merge.
+        np.nan and None values are skipped, as with the native_* functions, min and max are None until a value is seen.
+
+    """
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self, values: Union[list, np.ndarray, pd.Series] = None):
+        self.count, self.mean, self._m2, self.min, self.max = 0, 0.0, 0.0, None, None
+        if values is not None:
+            self.extend(values)
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean}, std={self.std()}, min={self.min}, max={self.max})"
+
+    def update(self, value: Union[int, float]) -> None:
+        """Add a single value."""
+        if value is None or value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def extend(self, values: Union[list, np.ndarray, pd.Series]) -> None:
+        """Add many values at once."""
+        data = _to_array(data=values)
+        if len(data):
+            other = RunningStats()
+            other.count, other.mean = len(data), float(data.sum()) / len(data)
+            d = data - other.mean
+            other._m2, other.min, other.max = float(d @ d), float(data.min()), float(data.max())
+            self.merge(other)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine with the stats of another shard, in place, and return self."""
+        if other.count:
+            n = self.count + other.count
+            delta = other.mean - self.mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / n
+            self.mean += delta * other.count / n
+            self.count = n
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def variance(self, ddof: int = 1) -> float:
+        """Variance, 0.0 when no more than ddof values were seen, as native_variance."""
+        return self._m2 / (self.count - ddof) if self.count > ddof else 0.0
+
+    def std(self, ddof: int = 1) -> float:
+        """Standard Deviation, see variance."""
+        return self.variance(ddof=ddof) ** .5
+
+
+class QuantileSketch:
+    """
+
+    A mergeable sketch of a stream of values that answers medians and percentiles in bounded memory.
+
+    :param alpha: Relative accuracy of the answers, default is 0.01. *Optional*
+    :type alpha: float
+    :param values: Values to start with, default is None. *Optional*
+    :type values: list, np.ndarray, or pd.Series
+    :example:
+        >>> sketch = QuantileSketch()
+        >>> for row in rows:
+        ...     if row['move'] == 'Call':
+        ...         sketch.update(row['value'])
+        >>> sketch.median(), sketch.quantile(q=.9)
+    :note: Values are counted in buckets whose bounds grow by (1 + alpha) / (1 - alpha), so any quantile is within
+        alpha of the true value relative to its size, and repeated amounts share a bucket.
+        Sketches merge by adding bucket counts, only sketches with the same alpha can be merged.
+
+    """
+    __slots__ = ('alpha', 'count', '_gamma', '_log_gamma', '_pos', '_neg', '_zero')
+
+    def __init__(self, alpha: float = 0.01, values: Union[list, np.ndarray, pd.Series] = None):
+        if not 0 < alpha < 1:
+            raise AttributeError('alpha needs to be between 0 and 1.')
+        self.alpha, self.count = alpha, 0
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = np.log(self._gamma)
+        self._pos, self._neg, self._zero = {}, {}, 0
+        if values is not None:
+            self.extend(values)
+
+    def __repr__(self) -> str:
+        return f"QuantileSketch(alpha={self.alpha}, count={self.count}, buckets={len(self._pos) + len(self._neg)})"
+
+    def update(self, value: Union[int, float]) -> None:
+        """Add a single value."""
+        if value is None or value != value:
+            return
+        self.count += 1
+        if value == 0:
+            self._zero += 1
+            return
+        store = self._pos if value > 0 else self._neg
+        key = int(np.ceil(np.log(abs(value)) / self._log_gamma))
+        store[key] = store.get(key, 0) + 1
+
+    def extend(self, values: Union[list, np.ndarray, pd.Series]) -> None:
+        """Add many values at once."""
+        data = _to_array(data=values)
+        self.count += len(data)
+        self._zero += int((data == 0).sum())
+        for store, part in ((self._pos, data[data > 0]), (self._neg, -data[data < 0])):
+            keys, counts = np.unique(np.ceil(np.log(part) / self._log_gamma).astype(np.int64), return_counts=True)
+            for k, c in zip(keys.tolist(), counts.tolist()):
+                store[k] = store.get(k, 0) + c
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Combine with the sketch of another shard, in place, and return self."""
+        if other.alpha != self.alpha:
+            raise AttributeError('alpha needs to match to merge sketches.')
+        for store, o in ((self._pos, other._pos), (self._neg, other._neg)):
+            for k, c in o.items():
+                store[k] = store.get(k, 0) + c
+        self._zero += other._zero
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Value at rank q * (count - 1) of the sorted values, rounded down, 0.0 when empty.
+        """
+        if not self.count:
+            return 0.0
+        def value(k: int) -> float:
+            return 2 * self._gamma ** k / (self._gamma + 1)
+
+        buckets = [(-value(k), self._neg[k]) for k in sorted(self._neg, reverse=True)] + [(0.0, self._zero)]
+        buckets += [(value(k), self._pos[k]) for k in sorted(self._pos)]
+        rank, seen = int(q * (self.count - 1)), 0
+        for v, c in buckets:
+            seen += c
+            if seen > rank:
+                return v
+        return buckets[-1][0]
+
+    def median(self) -> float:
+        """See quantile."""
+        return self.quantile(q=.5)
+
+
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('Clubs', 'Diamonds', 'Hearts', 'Spades')
+# Card code = suit * 13 + rank, so '2 Clubs' is 0 and 'A Spades' is 51.
+DECK = tuple(f"{r} {s}" for s in SUITS for r in RANKS)
+CARD_CODES = {c: i for i, c in enumerate(DECK)}
+HAND_CATEGORIES = ('High', 'Pair', 'Two Pair', 'Three of a Kind', 'Straight', 'Flush', 'Full House',
+                   'Four of a Kind', 'Straight Flush', 'Royal Flush')
+
+
+def _top_ranks(mask: int) -> list:
+    return [r for r in range(12, -1, -1) if mask >> r & 1]
+
+
+def _pack_ranks(ranks: list) -> int:
+    v = 0
+    for r in ranks:
+        v = v * 13 + r
+    return v
+
+
+def _straight_high(mask: int) -> int:
+    """Top rank + 1 of the best straight in a 13 bit rank mask, 0 when there is none."""
+    for r in range(12, 3, -1):
+        if mask >> (r - 4) & 31 == 31:
+            return r + 1
+    return 4 if mask & 0b1000000001111 == 0b1000000001111 else 0
+
+
+# Lookup tables over every 13 bit rank mask.
+_STRAIGHT = [_straight_high(m) for m in range(8192)]
+_BIT_COUNT = [bin(m).count('1') for m in range(8192)]
+_TOP = [[_pack_ranks(_top_ranks(m)[:n]) for m in range(8192)] for n in range(6)]
+_SCALE = 13 ** 5
+
+
+def encode_cards(cards: Union[tuple, list, set]) -> list:
+    """
+
+    Convert card strings such as '10 Clubs' to integer card codes.
+
+    :param cards: Card strings or card codes.
+    :type cards: tuple, list, or set
+    :return: The card codes, duplicates removed.
+    :rtype: list
+    :example:
+        >>> encode_cards(['A Spades', '2 Clubs']) # [51, 0]
+    :note: Codes are suit * 13 + rank, with ranks 0 to 12 for 2 to A, see DECK.
+
+    """
+    return list(dict.fromkeys(c if isinstance(c, int) else CARD_CODES[c.strip()] for c in cards))
+
+
+def evaluate_hand(cards: Union[tuple, list, set]) -> tuple:
+    """
+
+    Find the best poker hand in up to seven cards.
+
+    :param cards: Card strings or card codes.
+    :type cards: tuple, list, or set
+    :return: The hand category (as returned by calculate_hand) and a rank, where a higher rank is a better hand.
+    :rtype: tuple
+    :example:
+        >>> evaluate_hand(['A Spades', 'A Clubs', '5 Hearts', '9 Hearts', '10 Diamonds']) # ('Pair', 732823)
+    :note: The rank is category * 13**5 + the ranks that break ties in base 13, so equal ranks split the pot.
+
+    """
+    suits, m1, m2, m3, m4 = [0, 0, 0, 0], 0, 0, 0, 0
+    for c in encode_cards(cards):
+        b = 1 << c % 13
+        suits[c // 13] |= b
+        m4 |= m3 & b
+        m3 |= m2 & b
+        m2 |= m1 & b
+        m1 |= b
+    if not m1:
+        return None, 0
+    for s in suits:
+        if _BIT_COUNT[s] >= 5:
+            high = _STRAIGHT[s]
+            if high == 13:
+                return 'Royal Flush', 9 * _SCALE + 12 * 13 ** 4
+            if high:
+                return 'Straight Flush', 8 * _SCALE + (high - 1) * 13 ** 4
+            flush = 5 * _SCALE + _TOP[5][s]
+            break
+    else:
+        flush = None
+    if m4:
+        quad = _TOP[1][m4]
+        return 'Four of a Kind', 7 * _SCALE + quad * 13 ** 4 + _TOP[1][m1 & ~(1 << quad)] * 13 ** 3
+    trip = _TOP[1][m3] if m3 else None
+    if m3 and m2 & ~(1 << trip):
+        return 'Full House', 6 * _SCALE + trip * 13 ** 4 + _TOP[1][m2 & ~(1 << trip)] * 13 ** 3
+    if flush:
+        return 'Flush', flush
+    if _STRAIGHT[m1]:
+        return 'Straight', 4 * _SCALE + (_STRAIGHT[m1] - 1) * 13 ** 4
+    if m3:
+        return 'Three of a Kind', 3 * _SCALE + trip * 13 ** 4 + _TOP[2][m1 & ~m3] * 13 ** 2
+    if _BIT_COUNT[m2] >= 2:
+        pairs = _TOP[2][m2]
+        kick = m1 & ~(1 << pairs // 13) & ~(1 << pairs % 13)
+        return 'Two Pair', 2 * _SCALE + pairs * 13 ** 3 + _TOP[1][kick] * 13 ** 2
+    if m2:
+        return 'Pair', _SCALE + _TOP[1][m2] * 13 ** 4 + _TOP[3][m1 & ~m2] * 13
+    high = _TOP[5][m1] * 13 ** (5 - min(_BIT_COUNT[m1], 5))
+    return f"{RANKS[_TOP[1][m1]]} High", high
+
+
 def calculate_hand(cards: Union[tuple, list]) -> str:
-    ace, cards = [], list(cards)
+    """
+
+    Name the best poker hand in a set of cards.
+
+    :param cards: Card strings.
+    :type cards: tuple, list, or set
+    :return: The hand category, such as 'Full House' or 'K High', None when no cards are given.
+    :rtype: str
+    :example:
+        >>> calculate_hand(['K Hearts', 'K Clubs', '2 Spades']) # 'Pair'
+    :note: See evaluate_hand for a comparable rank.
+
+    """
     if not cards:
         return None
-    for ind, card in enumerate(cards):
-        if 'J' in card:
-            cards[ind] = card.replace('J', '11')
-        elif 'Q' in card:
-            cards[ind] = card.replace('Q', '12')
-        elif 'K' in card:
-            cards[ind] = card.replace('K', '13')
-        elif 'A' in card:
-            cards[ind] = card.replace('A', '14')
-            ace.append(card.replace('A', '1'))
-    if ace:
-        cards.extend(ace)
-    cards = list(set(cards))
-    l = len(cards)
-    c_num = [int(card.split(' ')[0]) for card in cards]
-    c_suit = [card.split(' ')[1] for card in cards]
-
-
-    def find_pair(cards: List[int]) -> bool:
-        for card in cards:
-            if cards.count(card) == 2:
-                return True
-        return False
-
-
-    def find_two_pair(cards: List[int]) -> bool:
-        pair = 0
-        for card in cards:
-            if cards.count(card) == 2:
-                pair += 1
-                if pair == 2:
-                    return True
-        return False
-
-
-    def find_three_of_a_kind(cards: List[int]) -> bool:
-        for card in cards:
-            if cards.count(card) == 3:
-                return True
-        return False
-
-
-    def find_full_house(cards: List[int]) -> bool:
-        three, two = False, False
-        for card in cards:
-            if cards.count(card) == 3:
-                three = True
-            elif cards.count(card) == 2:
-                two = True
-
-        if three is True and two is True:
-            return True
-        else:
-            return False
-
-
-    def find_flush(cards: List[str]) -> bool:
-        for card in cards:
-            if cards.count(card) == 5:
-                return True
-        return False
-
-
-    def find_straight(cards: List[int]) -> bool:
-        values = sorted(cards, reverse=True)
-        t = []
-        for i, j in enumerate(values[:-1]):
-            if j - 1 == values[i + 1]:
-                t.append(j)
-        t.append(values[-1])
-        return t == list(range(t[0], t[0] - 5, -1))
-
-
-    def find_four_of_a_kind(cards: List[int]) -> bool:
-        for card in cards:
-            if cards.count(card) == 4:
-                return True
-        return False
-
-
-    def find_straight_flush(nums, suits):
-        if find_flush(cards=suits):
-            cards = []
-            for ind, card in enumerate(suits):
-                if suits.count(card) == 5:
-                    cards.append(nums[ind])
-            if find_straight(cards=cards):
-                return True
-        return False
-
-
-    def find_royal_flush(nums, suits):
-        if find_flush(cards=suits) and find_straight(cards=nums):
-            cards = sorted(tuple(zip(c_num, c_suit)), key=lambda x: x[0], reverse=True)[:5]
-            lst, suit = (14, 13, 12, 11, 10), cards[0][1]
-            for ind, card in enumerate(cards):
-                if card[0] != lst[ind]:
-                    return False
-        else:
-            return False
-        return True
-
-
-    if l >= 5 and find_royal_flush(nums=c_num, suits=c_suit):
-        return 'Royal Flush'
-    elif l >= 5 and find_straight_flush(nums=c_num, suits=c_suit):
-        return 'Straight Flush'
-    elif l >= 4 and find_four_of_a_kind(cards=c_num):
-        return 'Four of a Kind'
-    elif l >= 5 and find_full_house(cards=c_num):
-        return 'Full House'
-    elif l >= 5 and find_flush(cards=c_suit):
-        return 'Flush'
-    elif l >= 5 and find_straight(cards=c_num):
-        return 'Straight'
-    elif l >= 3 and find_three_of_a_kind(cards=c_num):
-        return 'Three of a Kind'
-    elif l >= 4 and find_two_pair(cards=c_num):
-        return 'Two Pair'
-    elif l >= 2 and find_pair(cards=c_num):
-        return 'Pair'
+    return evaluate_hand(cards)[0]
+
+
+_STRAIGHT_ARRAY = np.array(_STRAIGHT, dtype=np.int64)
+_BIT_COUNT_ARRAY = np.array(_BIT_COUNT, dtype=np.int64)
+_TOP_ARRAY = np.array(_TOP, dtype=np.int64)
+
+
+def encode_card_array(hands: list, width: int = 7) -> np.ndarray:
+    """
+
+    Convert lists of card strings to the card array used by evaluate_hands.
+
+    :param hands: One list of card strings (or card codes) per hand.
+    :type hands: list
+    :param width: Number of columns, hands with fewer cards are padded with -1.
+    :type width: int
+    :return: An (N, width) array of card codes.
+    :rtype: np.ndarray
+    :example: *None*
+    :note: Extra cards past width are dropped.
+
+    """
+    arr = np.full((len(hands), width), -1, dtype=np.int64)
+    for ind, cards in enumerate(hands):
+        codes = encode_cards(cards)[:width]
+        arr[ind, :len(codes)] = codes
+    return arr
+
+
+def evaluate_hands(cards: np.ndarray) -> tuple:
+    """
+
+    Find the best poker hand for every row of a card array, see evaluate_hand.
+
+    :param cards: An (N, k) integer array of card codes, -1 for missing cards.
+    :type cards: np.ndarray
+    :return: Category codes into HAND_CATEGORIES (-1 for rows without cards) and ranks, both (N,) arrays.
+    :rtype: tuple
+    :example:
+        >>> evaluate_hands(encode_card_array([['A Spades', 'A Clubs'], ['2 Clubs', '7 Hearts']])) # ([1, 0], [..])
+    :note: Rows must not repeat a card. The 'High' name of a row is f"{RANKS[ranks // 13 ** 4 % 13]} High".
+
+    """
+    cards = np.asarray(cards, dtype=np.int64).reshape(len(cards), -1)
+    # Same masks as evaluate_hand, built one column at a time over all rows.
+    deck, m1, m2, m3, m4 = (np.zeros(len(cards), dtype=np.int64) for _ in range(5))
+    for col in cards.T:
+        valid = col >= 0
+        deck |= np.where(valid, np.left_shift(1, np.maximum(col, 0)), 0)
+        b = np.where(valid, np.left_shift(1, col % 13), 0)
+        m4 |= m3 & b
+        m3 |= m2 & b
+        m2 |= m1 & b
+        m1 |= b
+
+    flush = np.zeros(len(cards), dtype=np.int64)
+    for s in range(4):
+        suit = deck >> 13 * s & 8191
+        flush = np.where(_BIT_COUNT_ARRAY[suit] >= 5, suit, flush)
+    straight_flush, straight = _STRAIGHT_ARRAY[flush], _STRAIGHT_ARRAY[m1]
+    quad, trip = _TOP_ARRAY[1][m4], _TOP_ARRAY[1][m3]
+    pairs = _TOP_ARRAY[2][m2]
+    pair_bits = np.left_shift(1, pairs // 13) | np.left_shift(1, pairs % 13)
+    full = m2 & ~np.left_shift(1, trip)
+    s4, s3, s2 = 13 ** 4, 13 ** 3, 13 ** 2
+
+    conditions = [straight_flush == 13, straight_flush > 0, m4 > 0, (m3 > 0) & (full > 0), flush > 0, straight > 0,
+                  m3 > 0, _BIT_COUNT_ARRAY[m2] >= 2, m2 > 0, m1 > 0]
+    categories = np.select(conditions, [9, 8, 7, 6, 5, 4, 3, 2, 1, 0], -1)
+    ranks = np.select(conditions,
+                      [12 * s4,
+                       (straight_flush - 1) * s4,
+                       quad * s4 + _TOP_ARRAY[1][m1 & ~np.left_shift(1, quad)] * s3,
+                       trip * s4 + _TOP_ARRAY[1][full] * s3,
+                       _TOP_ARRAY[5][flush],
+                       (straight - 1) * s4,
+                       trip * s4 + _TOP_ARRAY[2][m1 & ~m3] * s2,
+                       pairs * s3 + _TOP_ARRAY[1][m1 & ~pair_bits] * s2,
+                       _TOP_ARRAY[1][m2] * s4 + _TOP_ARRAY[3][m1 & ~m2] * 13,
+                       _TOP_ARRAY[5][m1] * 13 ** (5 - np.minimum(_BIT_COUNT_ARRAY[m1], 5))], 0)
+    return categories, np.where(categories >= 0, categories * _SCALE + ranks, 0)
+
+
+def _deal_patterns(board: int, opponents: int) -> np.ndarray:
+    """Every way to split board + 2 * opponents dealt cards into the board and opponent pairs.
+
+    Which opponent holds which pair does not change the result, so pairs are not ordered.
+    """
+    def split(positions: tuple, n: int):
+        if n == 0:
+            yield ()
+            return
+        for pair in combinations(positions[1:], 1):
+            rest = tuple(p for p in positions if p not in (positions[0],) + pair)
+            for tail in split(rest, n - 1):
+                yield (positions[0],) + pair + tail
+
+    positions, patterns = tuple(range(board + 2 * opponents)), []
+    for b in combinations(positions, board):
+        rest = tuple(p for p in positions if p not in b)
+        for pairs in split(rest, opponents):
+            patterns.append(b + pairs)
+    return np.array(patterns, dtype=np.int64).reshape(-1, board + 2 * opponents)
+
+
+def calculate_equity(hole: Union[tuple, list], board: Union[tuple, list] = None, opponents: int = 1,
+                     samples: int = 10000, seed=None, exact: Optional[bool] = None,
+                     max_exact: int = 2000000) -> dict:
+    """
+
+    Estimate the chance that hole cards win against random opponent hands.
+
+    :param hole: The player's two hole cards, as strings or card codes.
+    :type hole: tuple or list
+    :param board: The board cards dealt so far (0, 3, 4 or 5 cards).
+    :type board: tuple or list
+    :param opponents: Number of opponents, each dealt two random cards.
+    :type opponents: int
+    :param samples: Number of Monte Carlo deals.
+    :type samples: int
+    :param seed: Seed or np.random.SeedSequence for the random deals.
+    :type seed: int or np.random.SeedSequence
+    :param exact: True enumerates every deal, False samples, None enumerates when there are at most max_exact deals.
+    :type exact: bool
+    :param max_exact: Largest number of deals enumerated when exact is None.
+    :type max_exact: int
+    :return: The 'win' and 'tie' probabilities, 'equity' (ties split between the tied players) and the 'deals' used.
+    :rtype: dict
+    :example:
+        >>> calculate_equity(['A Spades', 'A Clubs'], seed=1)['equity'] # ~0.85
+    :note: Hands are scored with evaluate_hands.
+
+    """
+    hole, board = encode_cards(hole), encode_cards(board or [])
+    deck = np.array([c for c in range(52) if c not in set(hole + board)], dtype=np.int64)
+    need_board, need = 5 - len(board), 5 - len(board) + 2 * opponents
+    deals = comb(len(deck), need) * factorial(need) // (factorial(need_board) * 2 ** opponents * factorial(opponents))
+    if exact or (exact is None and deals <= max_exact):
+        patterns = _deal_patterns(need_board, opponents)
+        combos = np.fromiter((c for combo in combinations(range(len(deck)), need) for c in combo),
+                             dtype=np.int64).reshape(-1, need)
+        dealt = deck[combos[:, patterns]].reshape(-1, need)
     else:
-        return {14: 'A High', 13: 'K High', 12: 'Q High', 11: 'J High',
-                10: '10 High', 9: '9 High', 8: '8 High', 7: '7 High',
-                6: '6 High', 5: '5 High', 4: '4 High', 3: '3 High',
-                2: '2 High'}[max(c_num)]
+        rng = np.random.default_rng(seed)
+        dealt = deck[rng.random((samples, len(deck))).argsort(axis=1)[:, :need]]
+
+    n = len(dealt)
+    full_board = np.hstack([np.tile(np.array(board, dtype=np.int64), (n, 1)), dealt[:, :need_board]])
+    hero = evaluate_hands(np.hstack([np.tile(np.array(hole, dtype=np.int64), (n, 1)), full_board]))[1]
+    best, ties = np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    for o in range(opponents):
+        pair = dealt[:, need_board + 2 * o:need_board + 2 * o + 2]
+        villain = evaluate_hands(np.hstack([pair, full_board]))[1]
+        ties += villain == hero
+        best = np.maximum(best, villain)
+    win, tie = hero > best, (hero == best) & (ties > 0)
+    return {'win': float(win.mean()),
+            'tie': float(tie.mean()),
+            'equity': float((win + tie / (ties + 1)).mean()),
+            'deals': n}
+
+
+def hand_equity(hole: Union[tuple, list], board: Union[tuple, list] = None, opponents: int = 1,
+                samples: int = 10000, seed=None, exact: Optional[bool] = None, max_exact: int = 100000) -> dict:
+    """
+
+    Calculate the equity of hole cards on each street of a board, see calculate_equity.
+
+    :param hole: The player's two hole cards.
+    :type hole: tuple or list
+    :param board: The full board, streets past its length are skipped.
+    :type board: tuple or list
+    :return: Equity by position ('Pre Flop', 'Post Flop', 'Post Turn', 'Post River').
+    :rtype: dict
+    :example: *None*
+    :note: Each street draws from its own child of the seed, so results do not depend on which streets are run.
+
+    """
+    board = list(board or [])
+    streets = [(p, n) for p, n in (('Pre Flop', 0), ('Post Flop', 3), ('Post Turn', 4), ('Post River', 5))
+               if n <= len(board)]
+    seeds = (seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)).spawn(4)
+    return {p: calculate_equity(hole, board[:n], opponents, samples, seeds[i], exact, max_exact)['equity']
+            for i, (p, n) in enumerate(streets)}
@@ -0,0 +1,18 @@
+"""
+Shared fixtures, small synthetic logs written by benchmarks.synthetic.
+"""
+import pytest
+from benchmarks.synthetic import write_log, write_logs, ME, GROUPED
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A folder of four synthetic logs of 30 hands each."""
+    folder = tmp_path / 'logs'
+    write_logs(str(folder), n_files=4, n_hands=30)
+    return folder
+
+
+@pytest.fixture
+def user_inputs(repo):
+    return {'me': ME, 'repo': str(repo), 'grouped': GROUPED}
@@ -0,0 +1,79 @@
+"""
+RunningStats and QuantileSketch, fed in shards and merged, against a single pass over all values.
+"""
+import numpy as np
+import pytest
+from poker.utils.tools import RunningStats, QuantileSketch
+
+
+@pytest.fixture
+def values():
+    rnd = np.random.default_rng(0)
+    data = np.concatenate([rnd.lognormal(4, 1.5, 4000), -rnd.lognormal(2, 1, 500), np.zeros(200),
+                           rnd.integers(1, 20, 1000) * 25.0])
+    rnd.shuffle(data)
+    return data
+
+
+def _shards(values) -> list:
+    return np.array_split(values, [100, 1500, 1501, 4000])
+
+
+def _stats(stats: RunningStats) -> tuple:
+    return stats.count, stats.mean, stats.variance(), stats.variance(ddof=0), stats.min, stats.max
+
+
+def test_running_stats_single_pass(values):
+    stats = RunningStats(values)
+    assert _stats(stats) == pytest.approx((len(values), values.mean(), values.var(ddof=1), values.var(),
+                                           values.min(), values.max()), rel=1e-9)
+
+
+def test_running_stats_merge(values):
+    single = RunningStats()
+    for v in values.tolist():
+        single.update(v)
+    merged = RunningStats()
+    for part in _shards(values):
+        shard = RunningStats()
+        shard.extend(part)
+        merged.merge(shard)
+    assert _stats(merged) == pytest.approx(_stats(single), rel=1e-9)
+    assert _stats(merged.merge(RunningStats())) == pytest.approx(_stats(single), rel=1e-9)
+    assert _stats(RunningStats().merge(merged)) == pytest.approx(_stats(single), rel=1e-9)
+
+
+def test_running_stats_skips_missing():
+    stats = RunningStats([1.0, np.nan, 3.0])
+    stats.update(None)
+    stats.update(np.nan)
+    assert _stats(stats) == (2, 2.0, 2.0, 1.0, 1.0, 3.0)
+    assert _stats(RunningStats()) == (0, 0.0, 0.0, 0.0, None, None)
+
+
+def test_quantile_sketch_merge(values):
+    single = QuantileSketch(values=values)
+    merged = QuantileSketch()
+    for part in _shards(values):
+        merged.merge(QuantileSketch(values=part))
+    streamed = QuantileSketch()
+    for v in values.tolist():
+        streamed.update(v)
+    for sketch in (merged, streamed):
+        assert sketch.count == single.count
+        assert (sketch._pos, sketch._neg, sketch._zero) == (single._pos, single._neg, single._zero)
+    with pytest.raises(AttributeError):
+        merged.merge(QuantileSketch(alpha=.05))
+
+
+@pytest.mark.parametrize('alpha', [.01, .05])
+def test_quantile_sketch_relative_error(values, alpha):
+    sketch = QuantileSketch(alpha=alpha)
+    for part in _shards(values):
+        sketch.merge(QuantileSketch(alpha=alpha, values=part))
+    exact = np.sort(values)
+    for q in np.linspace(0, 1, 101):
+        true = exact[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q=q) - true) <= alpha * abs(true) * (1 + 1e-9)
+    assert sketch.median() == sketch.quantile(q=.5)
+    assert QuantileSketch().quantile(q=.5) == 0.0
@@ -0,0 +1,87 @@
+"""
+The on-disk parse cache of parse_games.
+"""
+import os
+import pickle
+import zlib
+import pytest
+from poker.utils import functions
+from poker.utils.functions import parse_games
+from benchmarks.synthetic import ME, GROUPED
+
+
+def _hand_key(hand) -> tuple:
+    return (hand.game_id, hand.hand_number, hand.start_time, hand.end_time, hand.starting_chips,
+            hand.ending_chips, hand.pot_size, hand.winner, hand.all_cards)
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Counts the files parse_games hands to parser, the ones the cache missed."""
+    calls = []
+    parser = functions.parser
+
+    def spy(repo, file_name, *args):
+        calls.append(file_name)
+        return parser(repo, file_name, *args)
+
+    monkeypatch.setattr(functions, 'parser', spy)
+    return calls
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_cold_and_warm_loads_match(repo, tmp_path, parsed, compact):
+    cache = str(tmp_path / 'cache')
+    rows, hands = parse_games(str(repo), ME, GROUPED, compact=compact)
+    cold = parse_games(str(repo), ME, GROUPED, cache=cache, compact=compact)
+    assert len(parsed) == 2 * len(os.listdir(repo))
+    warm = parse_games(str(repo), ME, GROUPED, cache=cache, compact=compact)
+    assert len(parsed) == 2 * len(os.listdir(repo))
+    for result in (cold, warm):
+        assert result[0] == rows
+        assert [_hand_key(h) for h in result[1]] == [_hand_key(h) for h in hands]
+
+
+def test_parser_version_invalidates(repo, tmp_path, parsed, monkeypatch):
+    cache = str(tmp_path / 'cache')
+    parse_games(str(repo), ME, GROUPED, cache=cache)
+    monkeypatch.setattr(functions, 'PARSER_VERSION', functions.PARSER_VERSION + 1)
+    parse_games(str(repo), ME, GROUPED, cache=cache)
+    assert len(parsed) == 2 * len(os.listdir(repo))
+    assert len(os.listdir(cache)) == 2 * len(os.listdir(repo))
+
+
+@pytest.mark.parametrize('context', [{'user_name': 'Other @ nobody'},
+                                     {'grouped': dict(GROUPED, Peter=('someone-else',))},
+                                     {'compact': True}])
+def test_context_invalidates(repo, tmp_path, parsed, context):
+    cache = str(tmp_path / 'cache')
+    inputs = {'repo': str(repo), 'user_name': ME, 'grouped': GROUPED, 'cache': cache}
+    parse_games(**inputs)
+    parse_games(**dict(inputs, **context))
+    assert len(parsed) == 2 * len(os.listdir(repo))
+
+
+def test_changed_file_invalidates(repo, tmp_path, parsed):
+    cache = str(tmp_path / 'cache')
+    parse_games(str(repo), ME, GROUPED, cache=cache)
+    name = sorted(os.listdir(repo))[0]
+    with open(os.path.join(repo, name), 'a') as f:
+        f.write('"-- extra line --",2021-01-01T00:00:00.000Z,1\n')
+    parse_games(str(repo), ME, GROUPED, cache=cache)
+    assert parsed[len(os.listdir(repo)):] == [name]
+
+
+@pytest.mark.parametrize('content', [b'', b'not zlib', zlib.compress(b'not a pickle'),
+                                     zlib.compress(pickle.dumps(object)), zlib.compress(pickle.dumps('ab'))])
+def test_corrupt_entry_is_a_miss(repo, tmp_path, parsed, content):
+    cache = str(tmp_path / 'cache')
+    rows, hands = parse_games(str(repo), ME, GROUPED, cache=cache)
+    entries = sorted(os.listdir(cache))
+    with open(os.path.join(cache, entries[0]), 'wb') as f:
+        f.write(content)
+    assert parse_games(str(repo), ME, GROUPED, cache=cache)[0] == rows
+    assert len(parsed) == len(os.listdir(repo)) + 1
+    assert sorted(os.listdir(cache)) == entries
+    parse_games(str(repo), ME, GROUPED, cache=cache)
+    assert len(parsed) == len(os.listdir(repo)) + 1
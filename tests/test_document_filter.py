@@ -0,0 +1,47 @@
+"""
+DocumentFilter selections and the Poker methods that take one.
+"""
+import pytest
+from poker.classes.poker import Poker
+from poker.classes.document_filter import DocumentFilter
+from poker.utils.class_functions import _group_name_blank
+
+
+@pytest.fixture(params=[False, True], ids=['rows', 'columnar'])
+def poker(request, user_inputs):
+    return Poker(dict(user_inputs, columnar=request.param, memo_size=0))
+
+
+def test_filter_game_id(poker):
+    game = poker.hands[-1].game_id
+    f = DocumentFilter(poker, game_id_lst=game)
+    assert f.rows == [i for i in poker.rows if i['game_id'] == game]
+    assert f.hands == [h for h in poker.hands if h.game_id == game]
+
+
+def test_filter_player(poker):
+    f = DocumentFilter(poker, player_lst='Peter')
+    assert f.row_index.tolist() == poker._index['rows']['Peter']
+    assert f.hand_index.tolist() == sorted(set(i for i, _ in poker._index['hands']['Peter']))
+
+
+def test_filter_hand_range_and_move(poker):
+    f = DocumentFilter(poker, hand_range=(3, 5), move_lst=['Call', 'Raise'])
+    assert f.rows == [i for i in poker.rows
+                      if 3 <= i.get('hand_number', -1) <= 5 and i.get('move') in ('Call', 'Raise')]
+    assert f.hands == [h for h in poker.hands if 3 <= h.hand_number <= 5]
+
+
+def test_filter_matches_totals(poker):
+    f = DocumentFilter(poker, game_id_lst=sorted({i['game_id'] for i in poker.rows}))
+    assert len(f.rows) == len(poker.rows) and len(f.hands) == len(poker.hands)
+    assert poker.running_total(f) == poker.running_total()
+    assert poker.card_count(f) == poker.card_count()
+
+
+def test_empty_filter(poker):
+    f = DocumentFilter(poker, game_id_lst='x.csv')
+    assert f.rows == [] and f.hands == []
+    assert poker.running_total(f) == _group_name_blank(poker.grouped, 0.0)
+    assert poker.card_count(f) == {}
+    assert poker.player_stats('Peter', f)['total_hand_count'] == 0
@@ -0,0 +1,45 @@
+"""
+calculate_equity and hand_equity, enumerated deals against Monte Carlo samples.
+"""
+from math import comb, factorial
+import pytest
+from poker.utils.tools import calculate_equity, hand_equity
+
+HOLE = ['A Spades', 'K Spades']
+BOARD = ['2 Hearts', '7 Clubs', 'J Spades', 'Q Spades', '9 Diamonds']
+
+
+@pytest.mark.parametrize('hole, board, opponents', [(HOLE, BOARD[:4], 1), (HOLE, BOARD, 1), (HOLE, BOARD, 2),
+                                                    (['7 Hearts', '7 Diamonds'], BOARD[:4], 1)])
+def test_exact_matches_sampled(hole, board, opponents):
+    exact = calculate_equity(hole, board, opponents, exact=True)
+    left = 52 - len(hole) - len(board)
+    deals = comb(left, 5 - len(board))
+    for i in range(opponents):
+        deals *= comb(left - (5 - len(board)) - 2 * i, 2)
+    # Opponents are interchangeable, each set of opponent hands is dealt once.
+    assert exact['deals'] == deals // factorial(opponents)
+    sampled = calculate_equity(hole, board, opponents, samples=20000, seed=3, exact=False)
+    assert sampled['deals'] == 20000
+    for key in ('win', 'tie', 'equity'):
+        assert sampled[key] == pytest.approx(exact[key], abs=.02)
+    assert calculate_equity(hole, board, opponents, exact=None) == exact
+
+
+def test_exact_board_tie():
+    board = ['10 Hearts', 'J Hearts', 'Q Hearts', 'K Hearts', 'A Hearts']
+    result = calculate_equity(['2 Clubs', '3 Clubs'], board, opponents=2, exact=True)
+    assert (result['win'], result['tie'], result['equity']) == (0.0, 1.0, pytest.approx(1 / 3))
+
+
+def test_hand_equity_exact_matches_sampled():
+    # Turn and river are enumerated under max_exact, pre flop and flop are sampled either way.
+    exact = hand_equity(HOLE, BOARD, samples=20000, seed=5)
+    sampled = hand_equity(HOLE, BOARD, samples=20000, seed=5, exact=False)
+    assert list(exact) == list(sampled) == ['Pre Flop', 'Post Flop', 'Post Turn', 'Post River']
+    assert exact['Post Turn'] == calculate_equity(HOLE, BOARD[:4], exact=True)['equity']
+    assert exact['Post River'] == calculate_equity(HOLE, BOARD, exact=True)['equity']
+    assert exact['Pre Flop'] == sampled['Pre Flop'] and exact['Post Flop'] == sampled['Post Flop']
+    for street in exact:
+        assert sampled[street] == pytest.approx(exact[street], abs=.02)
+    assert list(hand_equity(HOLE, BOARD[:3], samples=1000, seed=5)) == ['Pre Flop', 'Post Flop']
@@ -0,0 +1,126 @@
+"""
+Hand categories and rank ordering of evaluate_hand, evaluate_hands and calculate_hand.
+"""
+import random
+from itertools import combinations
+import pytest
+from poker.utils.tools import (RANKS, DECK, HAND_CATEGORIES, evaluate_hand, evaluate_hands, calculate_hand,
+                               encode_card_array)
+
+
+def _five_card(cards: tuple) -> tuple:
+    """Category index and tie-break ranks of exactly five cards, classified directly."""
+    ranks = sorted((RANKS.index(c.split(' ')[0]) for c in cards), reverse=True)
+    counts = sorted(((ranks.count(r), r) for r in set(ranks)), reverse=True)
+    flush = len({c.split(' ')[1] for c in cards}) == 1
+    unique = sorted(set(ranks), reverse=True)
+    straight = None
+    if len(unique) == 5 and unique[0] - unique[4] == 4:
+        straight = unique[0]
+    elif unique == [12, 3, 2, 1, 0]:
+        straight = 3
+    if straight is not None and flush:
+        return (9 if straight == 12 else 8), (straight,)
+    shape = [n for n, _ in counts]
+    tie = tuple(r for _, r in counts)
+    if shape == [4, 1]:
+        return 7, tie
+    if shape == [3, 2]:
+        return 6, tie
+    if flush:
+        return 5, tuple(ranks)
+    if straight is not None:
+        return 4, (straight,)
+    return {(3, 1, 1): 3, (2, 2, 1): 2, (2, 1, 1, 1): 1}.get(tuple(shape), 0), tie
+
+
+def _best(cards: tuple) -> tuple:
+    return max(_five_card(c) for c in combinations(cards, 5))
+
+
+def _name(category: int, tie: tuple) -> str:
+    return f"{RANKS[tie[0]]} High" if category == 0 else HAND_CATEGORIES[category]
+
+
+@pytest.mark.parametrize('cards, category', [
+    (['A Hearts', 'K Hearts', 'Q Hearts', 'J Hearts', '10 Hearts', '2 Clubs', '3 Clubs'], 'Royal Flush'),
+    (['5 Spades', '4 Spades', '3 Spades', '2 Spades', 'A Spades', 'K Hearts', 'Q Clubs'], 'Straight Flush'),
+    (['9 Clubs', '9 Hearts', '9 Spades', '9 Diamonds', '2 Clubs'], 'Four of a Kind'),
+    (['9 Clubs', '9 Hearts', '9 Spades', '2 Diamonds', '2 Clubs', '2 Hearts', 'K Clubs'], 'Full House'),
+    (['2 Hearts', '5 Hearts', '9 Hearts', 'J Hearts', 'K Hearts', 'A Hearts', '3 Clubs'], 'Flush'),
+    (['A Clubs', '2 Hearts', '3 Spades', '4 Diamonds', '5 Clubs', 'K Hearts', 'K Spades'], 'Straight'),
+    (['7 Clubs', '7 Hearts', '7 Spades', 'K Diamonds', '2 Clubs'], 'Three of a Kind'),
+    (['7 Clubs', '7 Hearts', '2 Spades', '2 Diamonds', '3 Clubs', '3 Hearts', 'A Clubs'], 'Two Pair'),
+    (['K Hearts', 'K Clubs', '2 Spades', '7 Diamonds', '9 Clubs'], 'Pair'),
+    (['K Hearts', 'J Clubs', '2 Spades', '7 Diamonds', '9 Clubs'], 'K High'),
+    (['10 Hearts', '3 Clubs'], '10 High'),
+])
+def test_categories(cards, category):
+    assert calculate_hand(cards) == category
+    assert evaluate_hand(cards)[0] == category
+
+
+def test_single_pair_is_not_two_pair():
+    # The counting evaluator this replaced reported both of these as 'Two Pair', it counted each paired card.
+    assert calculate_hand(['K Hearts', 'K Clubs', '2 Spades', '7 Diamonds', '9 Clubs']) == 'Pair'
+    assert calculate_hand(['K Hearts', 'K Clubs', '2 Spades', '2 Diamonds', '9 Clubs']) == 'Two Pair'
+    assert calculate_hand(['Q Hearts', 'Q Clubs', '4 Spades', '8 Diamonds', '9 Clubs', 'J Clubs', '2 Hearts']) == 'Pair'
+
+
+def test_no_cards():
+    assert calculate_hand([]) is None
+    assert evaluate_hand([]) == (None, 0)
+
+
+def test_rank_ordering():
+    # Best to worst, each hand beats the next.
+    hands = [['A Hearts', 'K Hearts', 'Q Hearts', 'J Hearts', '10 Hearts'],
+             ['9 Hearts', 'K Hearts', 'Q Hearts', 'J Hearts', '10 Hearts'],
+             ['5 Spades', '4 Spades', '3 Spades', '2 Spades', 'A Spades'],
+             ['9 Clubs', '9 Hearts', '9 Spades', '9 Diamonds', 'K Clubs'],
+             ['9 Clubs', '9 Hearts', '9 Spades', '9 Diamonds', '2 Clubs'],
+             ['9 Clubs', '9 Hearts', '9 Spades', 'K Diamonds', 'K Clubs'],
+             ['9 Clubs', '9 Hearts', '9 Spades', '2 Diamonds', '2 Clubs'],
+             ['2 Hearts', '5 Hearts', '9 Hearts', 'J Hearts', 'A Hearts'],
+             ['2 Hearts', '5 Hearts', '9 Hearts', '10 Hearts', 'K Hearts'],
+             ['6 Clubs', '2 Hearts', '3 Spades', '4 Diamonds', '5 Clubs'],
+             ['A Clubs', '2 Hearts', '3 Spades', '4 Diamonds', '5 Clubs'],
+             ['7 Clubs', '7 Hearts', '7 Spades', 'K Diamonds', '2 Clubs'],
+             ['A Clubs', 'A Hearts', '3 Spades', '3 Diamonds', '5 Clubs'],
+             ['K Clubs', 'K Hearts', 'Q Spades', 'Q Diamonds', '5 Clubs'],
+             ['K Clubs', 'K Hearts', 'Q Spades', 'Q Diamonds', '4 Clubs'],
+             ['K Hearts', 'K Clubs', '9 Spades', '7 Diamonds', '3 Clubs'],
+             ['K Hearts', 'K Clubs', '9 Spades', '7 Diamonds', '2 Clubs'],
+             ['Q Hearts', 'Q Clubs', 'A Spades', '7 Diamonds', '2 Clubs'],
+             ['A Hearts', 'J Clubs', '2 Spades', '7 Diamonds', '9 Clubs'],
+             ['K Hearts', 'J Clubs', '2 Spades', '7 Diamonds', '9 Clubs'],
+             ['K Hearts', 'J Clubs', '2 Spades', '6 Diamonds', '9 Clubs']]
+    ranks = [evaluate_hand(h)[1] for h in hands]
+    assert all(a > b for a, b in zip(ranks, ranks[1:]))
+
+
+def test_equal_hands_split():
+    a = evaluate_hand(['K Hearts', 'K Clubs', '9 Spades', '7 Diamonds', '3 Clubs', '2 Hearts', '4 Spades'])
+    b = evaluate_hand(['K Spades', 'K Diamonds', '9 Hearts', '7 Clubs', '3 Hearts', '2 Clubs', '4 Diamonds'])
+    assert a == b
+
+
+def test_matches_five_card_classifier():
+    rnd = random.Random(0)
+    hands = [tuple(rnd.sample(DECK, rnd.choice((5, 6, 7)))) for _ in range(3000)]
+    expected = [_best(h) for h in hands]
+    results = [evaluate_hand(h) for h in hands]
+    assert [r[0] for r in results] == [_name(*e) for e in expected]
+    for (a, ra), (b, rb) in zip(zip(expected, results), zip(expected[1:], results[1:])):
+        assert (a > b) == (ra[1] > rb[1]) and (a == b) == (ra[1] == rb[1])
+
+
+def test_evaluate_hands_matches_evaluate_hand():
+    rnd = random.Random(1)
+    hands = [rnd.sample(DECK, rnd.choice((2, 5, 6, 7))) for _ in range(2000)] + [[]]
+    categories, ranks = evaluate_hands(encode_card_array(hands))
+    for h, c, r in zip(hands, categories, ranks):
+        name, rank = evaluate_hand(h)
+        assert (HAND_CATEGORIES[c] if c >= 0 else None) == (None if name is None else
+                                                            'High' if name.endswith(' High') else name)
+        assert r == rank
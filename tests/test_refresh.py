@@ -0,0 +1,123 @@
+"""
+Poker.refresh against a Poker loaded fresh from the same folder.
+"""
+import os
+import numpy as np
+import pytest
+from poker.classes.poker import Poker
+from benchmarks.synthetic import write_log
+
+
+def _row_key(row: dict) -> tuple:
+    return row['game_id'], row['order']
+
+
+def _hand_key(hand) -> tuple:
+    return hand.game_id, hand.hand_number, tuple(sorted(hand.starting_chips.items())), hand.pot_size
+
+
+def _by_game(p: Poker) -> tuple:
+    rows, hands = {}, {}
+    for i in p.rows:
+        rows.setdefault(i['game_id'], []).append(i)
+    for h in p.hands:
+        hands.setdefault(h.game_id, []).append(_hand_key(h))
+    return rows, hands
+
+
+def _index(p: Poker) -> dict:
+    """The player index with positions replaced by the rows and hands they point at."""
+    return {'rows': {k: sorted(_row_key(p.rows[i]) for i in v) for k, v in p._index['rows'].items()},
+            'hands': {k: sorted((_hand_key(p.hands[i]), s) for i, s in v) for k, v in p._index['hands'].items()},
+            'counts': (p._index['row_count'], p._index['hand_count'])}
+
+
+def _events(p: Poker) -> tuple:
+    """Every event and hand of the EventTable, decoded and sorted."""
+    t = p.events
+    e, h = t.events, t.hands
+    players, games = np.array(t.players + [None], dtype=object), np.array(t.games + [None], dtype=object)
+    events = sorted(zip(games[e['game']], e['hand'].tolist(), e['time'].tolist(), e['move'].tolist(),
+                        players[e['player']], np.nan_to_num(e['value'], nan=-1).tolist()), key=repr)
+    hands = sorted(zip(games[h['game']], h['hand'].tolist(), h['pot'].tolist()), key=repr)
+    cards = sorted(zip(games[e['game'][t.cards_table['event']]], e['time'][t.cards_table['event']].tolist(),
+                       np.array(t.cards, dtype=object)[t.cards_table['card']]), key=repr)
+    return events, hands, cards, t.running_total(p.resolver), t.card_count()
+
+
+def _assert_matches_fresh(p: Poker, inputs: dict) -> None:
+    fresh = Poker(dict(inputs, columnar=p.events is not None))
+    assert _by_game(p) == _by_game(fresh)
+    assert _index(p) == _index(fresh)
+    if p.events is not None:
+        assert len(p.events) == len(p.rows)
+        assert _events(p) == _events(fresh)
+    assert p.running_total() == fresh.running_total()
+    for name in inputs['grouped']:
+        assert p.player_stats(name) == fresh.player_stats(name)
+
+
+def _grow(folder, name: str, n_hands: int) -> None:
+    """Rewrite a synthetic log with more hands, its first hands are unchanged."""
+    path = os.path.join(folder, name)
+    stat = os.stat(path)
+    write_log(path, int(name[-7:-4]), n_hands)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_refresh_without_changes(user_inputs, columnar):
+    p = Poker(dict(user_inputs, columnar=columnar))
+    rows = p.rows
+    assert p.refresh() == 0
+    assert p.rows is rows
+    _assert_matches_fresh(p, user_inputs)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_refresh_new_file(user_inputs, repo, columnar):
+    p = Poker(dict(user_inputs, columnar=columnar))
+    n = write_log(os.path.join(repo, 'poker_now_log_009.csv'), 9, 20)
+    assert p.refresh() > 0
+    assert 0 < sum(i['game_id'] == 'poker_now_log_009.csv' for i in p.rows) <= n
+    _assert_matches_fresh(p, user_inputs)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_refresh_grown_file(user_inputs, repo, columnar):
+    p = Poker(dict(user_inputs, columnar=columnar))
+    # A game in the middle grows, it moves last, then grows again as the tail.
+    name = list(p._spans)[1]
+    before = sum(i['game_id'] == name for i in p.rows)
+    _grow(repo, name, 40)
+    p.refresh()
+    assert list(p._spans)[-1] == name
+    assert sum(i['game_id'] == name for i in p.rows) > before
+    _assert_matches_fresh(p, user_inputs)
+    _grow(repo, name, 50)
+    p.refresh()
+    _assert_matches_fresh(p, user_inputs)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_refresh_deleted_file(user_inputs, repo, columnar):
+    p = Poker(dict(user_inputs, columnar=columnar))
+    name = list(p._spans)[0]
+    os.remove(os.path.join(repo, name))
+    assert p.refresh() == 0
+    assert name not in p._spans and all(i['game_id'] != name for i in p.rows)
+    _assert_matches_fresh(p, user_inputs)
+
+
+def test_refresh_spans(user_inputs, repo):
+    p = Poker(user_inputs)
+    _grow(repo, list(p._spans)[0], 35)
+    os.remove(os.path.join(repo, list(p._spans)[2]))
+    write_log(os.path.join(repo, 'poker_now_log_007.csv'), 7, 10)
+    p.refresh()
+    for game, (r0, r1, h0, h1) in p._spans.items():
+        assert all(i['game_id'] == game for i in p.rows[r0:r1])
+        assert all(h.game_id == game for h in p.hands[h0:h1])
+    assert sum(s[1] - s[0] for s in p._spans.values()) == len(p.rows)
+    assert sum(s[3] - s[2] for s in p._spans.values()) == len(p.hands)
+    _assert_matches_fresh(p, user_inputs)